@@ -28,7 +28,7 @@ def mock_get(url: str) -> str | None:
     else:
         page = Path(THIS_DIR / "test_files/htmls/empty_page.html")
 
-    mock.text = Path(page).read_text()
+    mock.content = Path(page).read_bytes()
     return mock
 
 
@@ -87,6 +87,31 @@ class TestEventScraper(unittest.TestCase):
             ),
         )
 
+    @patch.object(requests.Session, "get", side_effect=mock_get)
+    def test_page_cache(self, mock_get: Mock) -> None:
+        event_urls = [
+            "http://example.com/event-details/event1",
+            "http://example.com/event-details/event2",
+        ]
+        self.scraper.scrape_events()
+
+        # The event pages downloaded by this instance are not downloaded again
+        mock_get.reset_mock()
+        self.scraper.get_fight_urls_from_event_urls(event_urls)
+        mock_get.assert_not_called()
+
+        # Other instances keep their own cache
+        other = UpcomingEventScraper(
+            data_folder=THIS_DIR / "test_files/run_files",
+            n_sessions=1,
+            delay=0,
+        )
+        self.assertIsNot(other.page_cache, self.scraper.page_cache)
+        other.get_fight_urls_from_event_urls(event_urls)
+        self.assertEqual(
+            sorted(call.args[0] for call in mock_get.call_args_list), event_urls
+        )
+
     def test_minor_methods(self) -> None:
         self.assertEqual(
             "http://www.ufcstats.com/event-details/event1",
@@ -10,6 +10,7 @@ import requests
 
 import ufcscraper
 from ufcscraper.fight_scraper import *
+from ufcscraper.ufc_scraper import UFCScraper
 from tests.tests_event_scraper import mock_get as mock_event_get
 
 THIS_DIR = Path(__file__).parent
@@ -45,7 +46,7 @@ def mock_get(url: str) -> str | None:
     else:
         page = Path(THIS_DIR / "test_files/htmls/empty_page.html")
 
-    mock.text = Path(page).read_text()
+    mock.content = Path(page).read_bytes()
     return mock
 
 
@@ -213,5 +214,112 @@ class TestFightScraper(unittest.TestCase):
             RoundsHandler.get_stats(fight_stats_select, 2, 0, 2)
 
 
+class TestUpcomingFightScraper(unittest.TestCase):
+    def setUp(self) -> None:
+        Path(THIS_DIR / "test_files/run_files").mkdir(exist_ok=True)
+        # fight1 is still listed, oldfight is no longer in the upcoming events
+        Path(THIS_DIR / "test_files/run_files/upcoming_fight_data.csv").write_text(
+            "fight_id,event_id,fighter_1,fighter_2,title_fight,weight_class\n"
+            "fight1,event1,fighter1,fighter2,F,Lightweight\n"
+            "oldfight,event9,fighter7,fighter8,F,Flyweight\n"
+        )
+        self.scraper = UpcomingFightScraper(
+            data_folder=THIS_DIR / "test_files/run_files",
+            n_sessions=1,
+            delay=0,
+        )
+
+    def tearDown(self) -> None:
+        rmtree(THIS_DIR / "test_files/run_files/")
+
+    @patch.object(
+        ufcscraper.fight_scraper.UpcomingFightScraper,
+        "get_fight_urls",
+        return_value=[
+            "http://www.example.com/fight-details/fight1",
+            "http://www.example.com/fight-details/fight2",
+        ],
+    )
+    @patch.object(requests.Session, "get", side_effect=mock_get)
+    def test_scrape_fights_replaces_outdated(
+        self, mock_get: Mock, mock_get_fight_urls: Mock
+    ) -> None:
+        self.scraper.scrape_fights()
+
+        # Only the new fight is downloaded
+        self.assertEqual(
+            [call.args[0] for call in mock_get.call_args_list],
+            ["http://www.example.com/fight-details/fight2"],
+        )
+
+        for data in (
+            self.scraper.data,
+            UpcomingFightScraper.read_csv(self.scraper.data_file),
+        ):
+            self.assertEqual(
+                data.values.tolist(),
+                [
+                    ["fight1", "event1", "fighter1", "fighter2", "F", "Lightweight"],
+                    [
+                        "fight2",
+                        "event1",
+                        "fighter3",
+                        "fighter4",
+                        "F",
+                        "Light Heavyweight",
+                    ],
+                ],
+            )
+
+
+class TestUFCScraperEventPages(unittest.TestCase):
+    def setUp(self) -> None:
+        Path(THIS_DIR / "test_files/run_files").mkdir(exist_ok=True)
+        copy(
+            THIS_DIR / "test_files/fighter_data.csv",
+            THIS_DIR / "test_files/run_files/.",
+        )
+        self.scraper = UFCScraper(
+            data_folder=THIS_DIR / "test_files/run_files",
+            n_sessions=1,
+            delay=0,
+        )
+
+    def tearDown(self) -> None:
+        rmtree(THIS_DIR / "test_files/run_files/")
+
+    @patch.object(
+        ufcscraper.event_scraper.EventScraper,
+        "url_from_id",
+        side_effect=mock_url_from_id_event,
+    )
+    @patch.object(requests.Session, "get", side_effect=mock_get)
+    def test_event_pages_downloaded_once(
+        self, mock_get: Mock, mock_url_from_id: Mock
+    ) -> None:
+        self.scraper.event_scraper.scrape_events()
+        self.scraper.fight_scraper.scrape_fights()
+
+        event_calls = [
+            call.args[0]
+            for call in mock_get.call_args_list
+            if "event-details" in call.args[0]
+        ]
+        self.assertEqual(
+            sorted(event_calls),
+            [
+                "http://example.com/event-details/event1",
+                "http://example.com/event-details/event2",
+                "http://example.com/event-details/event3",
+                "http://example.com/event-details/fail",
+                "http://example.com/event-details/none",
+            ],
+        )
+        self.assertEqual(
+            sorted(self.scraper.fight_scraper.data["fight_id"]),
+            [f"fight{i}" for i in range(1, 7)],
+        )
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -33,10 +33,14 @@ def mock_get(url: str) -> str | None:
         page = THIS_DIR / "test_files/htmls/fighter_page6.html"
     elif url == "http://example.com/fail":
         page = THIS_DIR / "test_files/htmls/fighter_page_fail.html"
+    elif url == "http://example.com/fighter_utf8":
+        # UTF-8 page without a charset in the document or the headers
+        page = THIS_DIR / "test_files/htmls/fighter_page_utf8.html"
+        mock.headers = {"Content-Type": "text/html"}
     else:
         page = THIS_DIR / "test_files/htmls/empty_page.html"
 
-    mock.text = Path(page).read_text()
+    mock.content = Path(page).read_bytes()
     return mock
 
 
@@ -110,6 +114,48 @@ class TestFighterScrape(unittest.TestCase):
             ],
         )
 
+    @patch.object(requests.Session, "get", side_effect=mock_get)
+    def test_scrape_fighters_utf8(self, mock_get: Mock) -> None:
+        with patch.object(
+            FighterScraper,
+            "get_fighter_urls",
+            return_value=["http://example.com/fighter_utf8"],
+        ):
+            self.scraper.scrape_fighters()
+
+        self.assertEqual(
+            self.scraper.data[
+                ["fighter_id", "fighter_f_name", "fighter_l_name", "fighter_nickname"]
+            ].values.tolist(),
+            [["fighter_utf8", "Jiří", "Procházka", "Denisa’s Samurái"]],
+        )
+
+    def test_parse_dob(self) -> None:
+        dob = Mock()
+
+        for text, expected in (
+            ("\n  DOB:\n  \n  Apr 20, 1936\n  \n  ", "1936-04-20"),
+            ("DOB: Jul 2, 1989", "1989-07-02"),
+            ("DOB: Feb 29, 2000", "2000-02-29"),
+            ("DOB:\n  --\n  ", ""),
+        ):
+            dob.text = text
+            self.assertEqual(self.scraper.parse_dob(dob), expected)
+
+        # Unexpected formats raise ValueError, as strptime does
+        for text in (
+            "DOB: July 22, 1989",
+            "DOB: 22/07/1989",
+            "DOB: Jul 22 1989",
+            "DOB: Feb 30, 2000",
+            "DOB: ",
+            "Jul 22, 1989",
+        ):
+            dob.text = text
+            with self.subTest(text=text):
+                with self.assertRaises(ValueError):
+                    self.scraper.parse_dob(dob)
+
     def test_minor_methods(self) -> None:
         self.assertEqual(
             "http://www.ufcstats.com/fighter-details/fighter1",
@@ -309,6 +309,88 @@ class TestOddsScraper(unittest.TestCase):
             ),
         )
 
+    def test_extract_valid_fights_from_odds_data(self) -> None:
+        fighter_missing_data = pd.DataFrame(
+            {
+                "event_date": [pd.Timestamp("2020-08-01"), pd.Timestamp("2020-09-02")],
+                "fight_id": ["fight4", "fight5"],
+                "fighter_id": ["fighter1", "fighter1"],
+                "opponent_id": ["fighter2", "fighter3"],
+                "UFC_names": [["John Doe"], ["John Doe"]],
+                "opponent_UFC_names": [["Jane Smith"], ["Max Power"]],
+            }
+        )
+        # John Doe was first booked against Liam Jones, the bout was
+        # rescheduled the next day against Jane Smith. On the second date
+        # BFO only lists an unrelated opponent.
+        odds_data = (
+            [
+                datetime.date(2020, 7, 31),
+                datetime.date(2020, 8, 1),
+                datetime.date(2020, 9, 2),
+            ],
+            ["John-Doe-1", "John-Doe-1", "John-Doe-1"],
+            ["John Doe", "John Doe", "John Doe"],
+            ["Liam-Jones-5", "Jane-Smith-2", "Sophia-Wilson-6"],
+            ["Liam Jones", "Smith Jane", "Sophia Wilson"],
+            [110, 120, 130],
+            [111, 121, 131],
+            [112, 122, 132],
+        )
+
+        odds_records, BFO_names = self.scraper.extract_valid_fights_from_odds_data(
+            fighter_missing_data, odds_data
+        )
+
+        self.assertEqual(odds_records, [["fight4", "fighter1", 120, 121, 122]])
+        self.assertEqual(
+            BFO_names,
+            {
+                ("fighter2", "Jane-Smith-2", "Smith Jane"),
+                ("fighter1", "John-Doe-1", "John Doe"),
+            },
+        )
+
+    def test_extract_valid_fights_from_odds_data_no_opponent_name(self) -> None:
+        fighter_missing_data = pd.DataFrame(
+            {
+                "event_date": [pd.Timestamp("2020-08-01"), pd.Timestamp("2020-08-01")],
+                "fight_id": ["fight4", "fight4"],
+                "fighter_id": ["fighter1", "fighter1"],
+                "opponent_id": ["fighter2", "fighter2"],
+                "UFC_names": [["John Doe"], ["John Doe"]],
+                # The opponent has no UFCStats name in the first record
+                "opponent_UFC_names": [[], ["Jane Smith"]],
+            }
+        )
+        odds_data = (
+            [datetime.date(2020, 8, 1)],
+            ["John-Doe-1"],
+            ["John Doe"],
+            ["Jane-Smith-2"],
+            ["Jane Smith"],
+            [120],
+            [121],
+            [122],
+        )
+
+        with self.assertLogs(
+            "ufcscraper.odds_scraper.bfo_scraper", level="INFO"
+        ) as logs:
+            odds_records, BFO_names = self.scraper.extract_valid_fights_from_odds_data(
+                fighter_missing_data, odds_data
+            )
+
+        self.assertIn("No UFCStats name for opponent fighter2", logs.output[0])
+        self.assertEqual(odds_records, [["fight4", "fighter1", 120, 121, 122]])
+        self.assertEqual(
+            BFO_names,
+            {
+                ("fighter2", "Jane-Smith-2", "Jane Smith"),
+                ("fighter1", "John-Doe-1", "John Doe"),
+            },
+        )
+
     @patch.object(
         BestFightOddsScraper,
         "worker_constructor_target",
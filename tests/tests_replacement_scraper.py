@@ -0,0 +1,79 @@
+from __future__ import annotations
+
+import unittest
+
+import pandas as pd
+
+from ufcscraper.replacement_scraper import ReplacementScraper
+
+
+def make_replacement_data() -> pd.DataFrame:
+    # Replacement records already merged with the fights of the same date,
+    # both orders of each fight are present as in `get_ufc_stats_data`.
+    return pd.DataFrame(
+        {
+            "Index": [0, 0, 1, 2, 2, 3, 3],
+            "Late Replacement": [
+                "Sean O'Malley",
+                "Sean O'Malley",
+                # Near miss, "Marlon Vera" vs "Marlon Moraes" scores 75
+                "Marlon Vera",
+                # Missing names never match
+                None,
+                None,
+                "Alex Perez",
+                "Alex Perez",
+            ],
+            "Opponent": [
+                "Marlon Vera",
+                "Marlon Vera",
+                "Paddy Pimblett",
+                "Jon Jones",
+                "Jon Jones",
+                "Jon Jones",
+                "Jon Jones",
+            ],
+            "fight_id": ["f1", "f1", "f2", "f3", "f4", "f3", "f5"],
+            "fighter_1": ["id1", "id2", "id3", "id4", "id6", "id4", "id7"],
+            "fighter_name": [
+                "Sean OMalley",
+                "Marlon Vera",
+                "Marlon Moraes",
+                "Alex Pereira",
+                None,
+                "Alex Pereira",
+                "Alexa Grasso",
+            ],
+            "opponent_name": [
+                "Marlon Vera",
+                "Sean OMalley",
+                "Paddy Pimblett",
+                "Jones Jon",
+                "Jon Jones",
+                "Jones Jon",
+                "Jon Jones",
+            ],
+        }
+    )
+
+
+class TestReplacementScraper(unittest.TestCase):
+    def test_best_name_matches(self) -> None:
+        matches = ReplacementScraper.best_name_matches(make_replacement_data())
+
+        self.assertEqual(
+            matches[["Index", "fight_id", "fighter_1"]].values.tolist(),
+            [[0, "f1", "id1"], [3, "f3", "id4"]],
+        )
+        self.assertEqual(matches["name_score"].tolist(), [96, 82])
+        self.assertEqual(matches["opponent_score"].tolist(), [100, 95])
+
+    def test_best_name_matches_no_match(self) -> None:
+        data = make_replacement_data()
+        matches = ReplacementScraper.best_name_matches(data[data["Index"] == 1])
+
+        self.assertTrue(matches.empty)
+
+
+if __name__ == "__main__":
+    unittest.main()
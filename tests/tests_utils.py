@@ -0,0 +1,125 @@
+from __future__ import annotations
+
+import unittest
+from pathlib import Path
+
+import bs4
+import requests
+from dateutil import parser
+
+from unittest.mock import patch, Mock
+from ufcscraper.utils import *
+
+THIS_DIR = Path(__file__).parent
+
+
+def mock_get(url: str) -> Mock:
+    mock = Mock()
+    # UTF-8 page without a charset in the document or the headers
+    mock.content = Path(THIS_DIR / "test_files/htmls/fighter_page_utf8.html").read_bytes()
+    mock.headers = {"Content-Type": "text/html"}
+    return mock
+
+
+class TestPageCache(unittest.TestCase):
+    def test_eviction(self) -> None:
+        cache = PageCache(maxsize=2)
+        cache.add("url1", b"page1")
+        cache.add("url2", b"page2")
+
+        # Reading url1 makes url2 the least recently used page
+        self.assertEqual(cache.get("url1"), b"page1")
+        cache.add("url3", b"page3")
+
+        self.assertIsNone(cache.get("url2"))
+        self.assertEqual(cache.get("url1"), b"page1")
+        self.assertEqual(cache.get("url3"), b"page3")
+        self.assertEqual(len(cache.pages), 2)
+
+    def test_links_to_htmls_cache_hits(self) -> None:
+        cache = PageCache()
+        cache.add("http://example.com/cached", b"cached page")
+
+        with patch.object(requests.Session, "get") as mock_get:
+            mock_get.return_value.content = b"downloaded page"
+            pages = dict(
+                links_to_htmls(
+                    ["http://example.com/cached", "http://example.com/new"],
+                    cache=cache,
+                )
+            )
+
+        mock_get.assert_called_once_with("http://example.com/new")
+        self.assertEqual(
+            pages,
+            {
+                "http://example.com/cached": b"cached page",
+                "http://example.com/new": b"downloaded page",
+            },
+        )
+        self.assertEqual(cache.get("http://example.com/new"), b"downloaded page")
+
+
+class TestParseDate(unittest.TestCase):
+    # (date string, source, whether it is handled by the strptime fast path)
+    cases = [
+        ("Jun 30th 2024", "BFO", True),
+        ("Apr 1st 2024", "BFO", True),
+        ("Nov 2nd 2023", "BFO", True),
+        ("Mar 3rd 2021", "BFO", True),
+        ("Dec 22nd 2019", "BFO", True),
+        ("July 22, 2023", "UFCStats event", True),
+        ("September 2, 2024", "UFCStats event", True),
+        ("Jul 22, 1989", "UFCStats DOB", True),
+        ("June 30 2024", "full month", True),
+        ("Sat 01 Jun 2024", "Bet365", False),
+        ("Sept 5th 2024", "abbreviation", False),
+    ]
+
+    def test_same_as_dateutil(self) -> None:
+        for date_str, source, fast_path in self.cases:
+            with self.subTest(date_str=date_str, source=source):
+                parse_date.cache_clear()
+                with patch(
+                    "ufcscraper.utils.parser.parse", wraps=parser.parse
+                ) as mock_parse:
+                    date = parse_date(date_str)
+
+                self.assertEqual(
+                    date, parser.parse(clean_date_string(date_str)).date()
+                )
+                self.assertEqual(mock_parse.called, not fast_path)
+
+    def test_invalid_date(self) -> None:
+        parse_date.cache_clear()
+        with patch("builtins.print"):
+            self.assertIsNone(parse_date("not a date"))
+
+
+class TestLinkToSoup(unittest.TestCase):
+    @patch.object(requests.Session, "get", side_effect=mock_get)
+    def test_utf8_page(self, mock_get: Mock) -> None:
+        soup = link_to_soup("http://example.com/fighter_utf8")
+
+        self.assertEqual(soup.select_one("span").text.strip(), "Jiří Procházka")
+        self.assertEqual(
+            soup.select_one("p.b-content__Nickname").text.strip(),
+            "Denisa’s Samurái",
+        )
+
+    @patch.object(requests.Session, "get", side_effect=mock_get)
+    def test_utf8_page_parse_only(self, mock_get: Mock) -> None:
+        soup = link_to_soup(
+            "http://example.com/fighter_utf8",
+            session=requests.Session(),
+            parse_only=bs4.SoupStrainer("span"),
+        )
+
+        self.assertEqual(
+            [span.text.strip() for span in soup.find_all("span")],
+            ["Jiří Procházka", "Record: 13-2-0"],
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -22,6 +22,9 @@ if TYPE_CHECKING:  # pragma: no cover
 
 logger = logging.getLogger(__name__)
 
+# Buffer size used when appending scraped rows to the CSV files.
+WRITE_BUFFER_SIZE = 1 << 20
+
 
 class BaseFileHandler(ABC):
     """Base class for file handlers associated with a CSV table.
@@ -43,8 +46,7 @@ class BaseFileHandler(ABC):
     sort_fields: List[str]
     data_folder: Path
     filename: str
-
-    data = pd.DataFrame([])
+    data: pd.DataFrame
 
     def __init__(
         self,
@@ -59,14 +61,31 @@ class BaseFileHandler(ABC):
         self.data_folder = Path(data_folder)
         self.data_file: Path = Path(self.data_folder) / self.filename
 
-        self.check_data_file()
-        self.load_data()
+        if self.check_data_file():
+            self.load_data()
+        else:
+            # The file only has the header, no need to read it.
+            self.data = self.empty_data()
+
+    @classmethod
+    def empty_data(cls) -> pd.DataFrame:
+        """Creates an empty DataFrame with the columns and types of the table.
 
-    def check_data_file(self) -> None:
+        Returns:
+            An empty DataFrame with one typed column per entry in `dtypes`.
+        """
+        return pd.DataFrame(
+            {col: pd.Series(dtype=dt) for col, dt in cls.dtypes.items()}
+        )
+
+    def check_data_file(self) -> bool:
         """Checks if the CSV file exists in the specified data folder.
 
         If the file does not exist, it creates a new file with the specified columns.
         Logs the status of the file (whether new or existing) using the logger.
+
+        Returns:
+            True if the file already existed, False if it has been created.
         """
         if not self.data_file.is_file():
             with open(self.data_file, "w", newline="", encoding="UTF8") as f:
@@ -74,28 +93,60 @@ class BaseFileHandler(ABC):
                 writer.writerow(self.dtypes.keys())
 
             logger.info(f"Using new file:\n\t{self.data_file}")
+            return False
         else:
             logger.info(f"Using existing file:\n\t{self.data_file}")
+            return True
 
-    def remove_duplicates_from_file(self) -> None:
-        """Removes duplicate rows from the CSV file.
+    @classmethod
+    def read_csv(cls, data_file: Path) -> pd.DataFrame:
+        """Reads a CSV file with the format of this table into a DataFrame.
 
-        This method reads the CSV file, removes any duplicate rows, and then
-        saves the cleaned data back to the same file.
+        The column types are taken from `dtypes`, so pandas does not need
+        to infer them, and date columns are parsed while reading.
+
+        Args:
+            data_file: The path to the CSV file.
+
+        Returns:
+            The DataFrame with the contents of the CSV file.
         """
         date_columns = [
-            col for col, dtype in self.dtypes.items() if dtype == "datetime64[ns]"
+            col for col, dtype in cls.dtypes.items() if dtype == "datetime64[ns]"
         ]
         non_date_types = {
             col: dtype
-            for col, dtype in self.dtypes.items()
+            for col, dtype in cls.dtypes.items()
             if dtype != "datetime64[ns]"
         }
-        data = pd.read_csv(
-            self.data_file, dtype=non_date_types, parse_dates=date_columns
-        ).drop_duplicates()
-        data = data.sort_values(by=self.sort_fields).reset_index(drop=True)
-        data.to_csv(self.data_file, index=False)
+        # The pyarrow engine is deliberately not used: with dtype=str it
+        # reads empty fields as the string "None", and its float parser
+        # does not round-trip the values written by `to_csv`.
+        return pd.read_csv(
+            data_file,
+            dtype=non_date_types,
+            parse_dates=date_columns,
+            engine="c",
+        )
+
+    def remove_duplicates_from_file(self) -> None:
+        """Removes duplicate rows from the CSV file.
+
+        This method reads the CSV file, removes any duplicate rows, and then
+        saves the cleaned data back to the same file. The file is only
+        rewritten if it contained duplicates or was not sorted.
+
+        The cleaned data is also stored in the `data` attribute, so there
+        is no need to call `load_data` afterwards.
+        """
+        data = self.read_csv(self.data_file)
+        duplicated = data.duplicated()
+        data = data[~duplicated].sort_values(by=self.sort_fields)
+
+        if duplicated.any() or not data.index.is_monotonic_increasing:
+            data.to_csv(self.data_file, index=False)
+
+        self.data = data.reset_index(drop=True)
 
     def load_data(self) -> None:
         """Loads the data from the CSV file into the `data` DataFrame.
@@ -103,17 +154,7 @@ class BaseFileHandler(ABC):
         This method reads the CSV file, removes duplicates, and stores the data
         in the `data` attribute for further processing.
         """
-        date_columns = [
-            col for col, dtype in self.dtypes.items() if dtype == "datetime64[ns]"
-        ]
-        non_date_types = {
-            col: dtype
-            for col, dtype in self.dtypes.items()
-            if dtype != "datetime64[ns]"
-        }
-        self.data = pd.read_csv(
-            self.data_file, dtype=non_date_types, parse_dates=date_columns
-        ).drop_duplicates()
+        self.data = self.read_csv(self.data_file).drop_duplicates()
 
 
 class BaseScraper(BaseFileHandler):
@@ -162,10 +203,7 @@ class BaseScraper(BaseFileHandler):
         Returns:
             The extracted ID as a string.
         """
-        if url[-1] == "/":
-            return BaseScraper.id_from_url(url[:-1])
-
-        return url.split("/")[-1]
+        return url.rstrip("/").rpartition("/")[2]
 
 
 class BaseHTMLReader(BaseFileHandler):
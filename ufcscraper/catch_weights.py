@@ -20,5 +20,4 @@ class CatchWeights(BaseFileHandler):
     }
 
     sort_fields = ["fight_id", "weight"]
-    data = pd.DataFrame({col: pd.Series(dtype=dt) for col, dt in dtypes.items()})
     filename = "catch_weights.csv"
\ No newline at end of file
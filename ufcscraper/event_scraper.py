@@ -10,21 +10,26 @@ used for further analysis.
 
 from __future__ import annotations
 
-import csv
 import datetime
 import logging
 from typing import TYPE_CHECKING, List
 
+import bs4
 import pandas as pd
 
 from ufcscraper.base import BaseScraper
-from ufcscraper.utils import link_to_soup, links_to_soups
+from ufcscraper.utils import PageCache, link_to_soup, links_to_htmls
 
 if TYPE_CHECKING:  # pragma: no cover
-    from typing import Dict, List
+    from pathlib import Path
+    from typing import Dict, List, Optional
 
 logger = logging.getLogger(__name__)
 
+EVENT_LINKS = bs4.SoupStrainer(
+    "a", href=lambda href: href is not None and "event-details" in href
+)
+
 
 class EventScraper(BaseScraper):
     """Scrapes event data from the UFCStats website.
@@ -43,9 +48,32 @@ class EventScraper(BaseScraper):
         "event_country": str,
     }
     sort_fields = ["event_date", "event_name"]
-    data = pd.DataFrame({col: pd.Series(dtype=dt) for col, dt in dtypes.items()})
     filename = "event_data.csv"
     event_type = "completed"
+    log_every: int = 10  # Number of event pages between progress messages
+
+    page_cache: PageCache
+
+    def __init__(
+        self,
+        data_folder: Path | str,
+        n_sessions: Optional[int] = None,
+        delay: Optional[float] = None,
+    ):
+        """Initializes the EventScraper with the specified parameters.
+
+        Event pages are read both to scrape the events and to get their
+        fights, each instance keeps its own cache of the pages it has
+        downloaded, so that they are not downloaded twice.
+
+        Args:
+            data_folder: The folder where the CSV file is stored or will be
+                created.
+            n_sessions: Number of concurrent sessions for scraping.
+            delay: Delay between requests to avoid being blocked.
+        """
+        super().__init__(data_folder, n_sessions, delay)
+        self.page_cache = PageCache()
 
     @classmethod
     def url_from_id(cls, id_: str) -> str:
@@ -66,53 +94,59 @@ class EventScraper(BaseScraper):
         UFCStats website, scrapes details of new events, and appends them to
         the CSV file. Logs the progress and any errors encountered.
         """
-        existing_urls = set(map(self.url_from_id, self.data["event_id"]))
-        ufcstats_event_urls = self.get_event_urls()
-        urls_to_scrape = set(ufcstats_event_urls) - existing_urls
+        existing_ids = set(self.data["event_id"])
+        urls_to_scrape = {
+            url
+            for url in self.get_event_urls()
+            if self.id_from_url(url) not in existing_ids
+        }
 
         logger.info(f"Scraping {len(urls_to_scrape)} events...")
 
-        with open(self.data_file, "a+") as f:
-            writer = csv.writer(f)
-
-            i = 0
-            for i, (url, soup) in enumerate(
-                links_to_soups(list(urls_to_scrape), self.n_sessions, self.delay)
-            ):
-                try:
-                    full_location = (
-                        soup.select("li")[4].text.split(":")[1].strip().split(",")
-                    )
-                    event_name = soup.select("h2")[0].text
-                    event_date = str(
-                        datetime.datetime.strptime(
-                            soup.select("li")[3].text.split(":")[-1].strip(),
-                            "%B %d, %Y",
-                        )
-                    )
-                    event_city = full_location[0]
-                    event_country = full_location[-1]
-
-                    # Check event location contains state details
-                    if len(full_location) > 2:
-                        event_state = full_location[1]
-                    else:
-                        event_state = ""
-
-                    writer.writerow(
-                        [
-                            self.id_from_url(url),
-                            event_name.strip(),
-                            event_date[0:10],
-                            event_city.strip(),
-                            event_state.strip(),
-                            event_country.strip(),
-                        ]
-                    )
-
-                    logger.info(f"Scraped {i+1}/{len(urls_to_scrape)} events...")
-                except Exception as e:
-                    logger.error(f"Error saving data from url: {url}\nError: {e}")
+        rows: List[List[str]] = []
+        i = 0
+        for i, (url, html) in enumerate(
+            links_to_htmls(
+                list(urls_to_scrape), self.n_sessions, self.delay, cache=self.page_cache
+            )
+        ):
+            soup = bs4.BeautifulSoup(html, "lxml")
+            try:
+                list_items = soup.find_all("li", limit=5)
+                full_location = list_items[4].text.partition(":")[2].strip().split(",")
+                event_name = soup.find_all("h2", limit=1)[0].text
+                event_date = datetime.datetime.strptime(
+                    list_items[3].text.rpartition(":")[2].strip(),
+                    "%B %d, %Y",
+                ).strftime("%Y-%m-%d")
+                event_city = full_location[0]
+                event_country = full_location[-1]
+
+                # Check event location contains state details
+                if len(full_location) > 2:
+                    event_state = full_location[1]
+                else:
+                    event_state = ""
+
+                rows.append(
+                    [
+                        self.id_from_url(url),
+                        event_name.strip(),
+                        event_date,
+                        event_city.strip(),
+                        event_state.strip(),
+                        event_country.strip(),
+                    ]
+                )
+
+                logger.info(f"Scraped {i+1}/{len(urls_to_scrape)} events...")
+            except Exception as e:
+                logger.error(f"Error saving data from url: {url}\nError: {e}")
+
+        # Append all the new rows in a single write
+        pd.DataFrame(rows, columns=list(self.dtypes)).to_csv(
+            self.data_file, mode="a", header=False, index=False
+        )
 
         self.remove_duplicates_from_file()
 
@@ -127,15 +161,16 @@ class EventScraper(BaseScraper):
         """
         logger.info("Scraping event links...")
 
+        # Only links with keyword 'event-details' are parsed
         soup = link_to_soup(
-            f"{self.web_url}/statistics/events/{self.event_type}?page=all"
+            f"{self.web_url}/statistics/events/{self.event_type}?page=all",
+            parse_only=EVENT_LINKS,
         )
 
-        # Adds href to list if href contains a link with keyword 'event-details'
         event_urls = [
-            item.get("href")
-            for item in soup.find_all("a")
-            if type(item.get("href")) == str and "event-details" in item.get("href")
+            href
+            for href in (item.get("href") for item in soup.find_all("a"))
+            if isinstance(href, str)
         ]
 
         logger.info(f"Got {len(event_urls)} event links...")
@@ -151,14 +186,17 @@ class EventScraper(BaseScraper):
             A list of fight URLs extracted from the provided event URLs.
         """
         fight_urls = set()
-        i = 1
-        for _, soup in links_to_soups(event_urls, self.n_sessions):
+        for i, (_, html) in enumerate(
+            links_to_htmls(event_urls, self.n_sessions, cache=self.page_cache),
+            start=1,
+        ):
+            soup = bs4.BeautifulSoup(html, "lxml")
             for item in soup.find_all("a", class_="b-flag b-flag_style_green"):
                 fight_urls.add(item.get("href"))
             for item in soup.find_all("a", class_="b-flag b-flag_style_bordered"):
                 fight_urls.add(item.get("href"))
-            print(f"Scraped {i}/{len(event_urls)} events...", end="\r")
-            i += 1
+            if i % self.log_every == 0 or i == len(event_urls):
+                logger.info(f"Scraped {i}/{len(event_urls)} events...")
 
         return list(fight_urls)
 
@@ -168,12 +206,15 @@ class UpcomingEventScraper(EventScraper):
 
     def get_fight_urls_from_event_urls(self, event_urls: List[str]) -> List[str]:
         fight_urls = set()
-        i = 1
-        for _, soup in links_to_soups(event_urls, self.n_sessions):
+        for i, (_, html) in enumerate(
+            links_to_htmls(event_urls, self.n_sessions, cache=self.page_cache),
+            start=1,
+        ):
+            soup = bs4.BeautifulSoup(html, "lxml")
             for item in soup.find_all("a", class_="b-link b-link_style_black"):
                 if "View" in item.get_text() and "Matchup" in item.get_text():
                     fight_urls.add(item.get("data-link"))
-            print(f"Scraped {i}/{len(event_urls)} events...", end="\r")
-            i += 1
+            if i % self.log_every == 0 or i == len(event_urls):
+                logger.info(f"Scraped {i}/{len(event_urls)} events...")
         
         return list(fight_urls)
\ No newline at end of file
@@ -22,19 +22,60 @@ import csv
 import logging
 import re
 from typing import TYPE_CHECKING
+
+import bs4
 import pandas as pd
+import soupsieve as sv
 
-from ufcscraper.base import BaseScraper, BaseFileHandler
+from ufcscraper.base import WRITE_BUFFER_SIZE, BaseScraper, BaseFileHandler
 from ufcscraper.event_scraper import EventScraper, UpcomingEventScraper
 from ufcscraper.fighter_scraper import FighterScraper
-from ufcscraper.utils import links_to_soups
+from ufcscraper.utils import links_to_htmls
 
 if TYPE_CHECKING:  # pragma: no cover
-    import bs4
-    from typing import Any, Dict, List, Tuple
+    from pathlib import Path
+    from typing import Any, Dict, List, Optional, Tuple
+
+    ParsedFight = Tuple[List[Any], List[Tuple[Any, ...]]]
 
 logger = logging.getLogger(__name__)
 
+# CSS selectors used on every fight page, compiled once.
+OVERVIEW = sv.compile("i.b-fight-details__text-item")
+RESULT = sv.compile("i.b-fight-details__text-item_first")
+RESULT_DETAILS = sv.compile("p.b-fight-details__text")
+FIGHT_DETAILS = sv.compile("p.b-fight-details__table-text")
+FIGHT_TYPE = sv.compile("i.b-fight-details__fight-title")
+WIN_LOSE = sv.compile("i.b-fight-details__person-status")
+EVENT_LINK = sv.compile("a.b-link")
+
+# Only the elements read by `parse_fight` (and their children) are built
+# into the soup, the rest of the page is skipped while parsing.
+FIGHT_PAGE_CLASSES = {
+    "b-content__title",  # h2 with the event link
+    "b-fight-details__text-item",
+    "b-fight-details__text-item_first",
+    "b-fight-details__text",
+    "b-fight-details__table-text",
+    "b-fight-details__fight-title",
+    "b-fight-details__person-status",
+    "b-fight-details__person-link",
+}
+FIGHT_PAGE_CONTENT = bs4.SoupStrainer(
+    # The class attribute is not split into a list yet while parsing
+    class_=lambda value: value is not None
+    and not FIGHT_PAGE_CLASSES.isdisjoint(value.split())
+)
+
+WEIGHT_RE = re.compile(r"\w*weight")
+TIME_RE = re.compile(r"\d:\d\d")
+# Judges scores (e.g., 27 - 30, 28 - 29, etc.)
+SCORE_RE = re.compile(r"(\d{1,2})\s*-\s*(\d{1,2})\.")
+
+# Number of scraped fights kept in memory before writing them to disk.
+WRITE_BATCH_SIZE = 100
+
+
 class BaseFightScraper(BaseScraper, ABC):
     """Base class for fight scrapers.
 
@@ -43,6 +84,28 @@ class BaseFightScraper(BaseScraper, ABC):
     """
     event_scraper = EventScraper
 
+    def __init__(
+        self,
+        data_folder: Path | str,
+        n_sessions: Optional[int] = None,
+        delay: Optional[float] = None,
+        event_scraper_instance: Optional[EventScraper] = None,
+    ):
+        """Initializes the fight scraper with the specified parameters.
+
+        Args:
+            data_folder: The folder where the CSV file is stored or will be
+                created.
+            n_sessions: Number of concurrent sessions for scraping.
+            delay: Delay between requests to avoid being blocked.
+            event_scraper_instance: Event scraper used to get the event
+                pages. Passing the instance that scraped the events reuses
+                the pages it already downloaded. If not provided, a new
+                one is created when needed.
+        """
+        super().__init__(data_folder, n_sessions, delay)
+        self.event_scraper_instance = event_scraper_instance
+
     @classmethod
     def url_from_id(cls, id_: str) -> str:
         """Constructs the fight URL using the fight ID.
@@ -68,16 +131,15 @@ class BaseFightScraper(BaseScraper, ABC):
         logger.info("Scraping fight links...")
 
         logger.info("Opening event information to extract event urls...")
-        event_scraper_instance = self.event_scraper(self.data_folder, self.n_sessions, self.delay)
+        event_scraper_instance = self.event_scraper_instance or self.event_scraper(
+            self.data_folder, self.n_sessions, self.delay
+        )
         event_ids = event_scraper_instance.data["event_id"].unique().tolist()
 
         # Remove events for which information is extracted
         if not get_all_events:
-            event_ids = [
-                id_
-                for id_ in event_ids
-                if id_ not in self.data["event_id"].unique().tolist()
-            ]
+            scraped_event_ids = set(self.data["event_id"])
+            event_ids = [id_ for id_ in event_ids if id_ not in scraped_event_ids]
 
         event_urls: List[str] = list(map(self.event_scraper.url_from_id, event_ids))
         fight_urls = event_scraper_instance.get_fight_urls_from_event_urls(event_urls)
@@ -87,12 +149,12 @@ class BaseFightScraper(BaseScraper, ABC):
 
     @staticmethod
     def get_fighters(
-        fight_details: bs4.element.ResultSet, fight_soup: bs4.BeautifulSoup
+        fight_details: List[bs4.element.Tag], fight_soup: bs4.BeautifulSoup
     ) -> Tuple[str, str]:
         """Extracts fighter IDs from the fight details.
 
         Args:
-            fight_details: A ResultSet containing fight detail information.
+            fight_details: The elements containing fight detail information.
             fight_soup: The BeautifulSoup object containing the fight page.
 
         Returns:
@@ -112,18 +174,18 @@ class BaseFightScraper(BaseScraper, ABC):
 
         fighter_1, fighter_2 = map(
             FighterScraper.id_from_url,
-            fighters,
+            map(str, fighters),
         )
 
         return fighter_1, fighter_2
 
     # Checks if fight is title fight
     @staticmethod
-    def get_title_fight(fight_type: bs4.element.ResultSet) -> str:
+    def get_title_fight(fight_type: List[bs4.element.Tag]) -> str:
         """Determines if the fight is a title fight.
 
         Args:
-            fight_type: A ResultSet containing fight type information.
+            fight_type: The elements containing fight type information.
 
         Returns:
             'T' if it's a title fight, 'F' otherwise.
@@ -135,32 +197,29 @@ class BaseFightScraper(BaseScraper, ABC):
 
     # Scrapes weight class of fight
     @staticmethod
-    def get_weight_class(fight_type: bs4.element.ResultSet) -> str:
+    def get_weight_class(fight_type: List[bs4.element.Tag]) -> str:
         """Extracts the weight class of the fight.
 
         Args:
-            fight_type: A ResultSet containing fight type information.
+            fight_type: The elements containing fight type information.
 
         Returns:
             The weight class of the fight, or '' if not found.
         """
-        if "Light Heavyweight" in fight_type[0].text.strip():
-            return "Light Heavyweight"
+        text = fight_type[0].text.strip()
 
-        elif "Women" in fight_type[0].text.strip():
-            return "Women's " + re.findall(r"\w*weight", fight_type[0].text.strip())[0]
+        if "Light Heavyweight" in text:
+            return "Light Heavyweight"
 
-        elif "Catch Weight" in fight_type[0].text.strip():
-            return "Catch Weight"
+        if "Women" in text:
+            return "Women's " + WEIGHT_RE.findall(text)[0]
 
-        elif "Open Weight" in fight_type[0].text.strip():
-            return "Open Weight"
+        for weight_class in ("Catch Weight", "Open Weight"):
+            if weight_class in text:
+                return weight_class
 
-        else:
-            try:
-                return re.findall(r"\w*weight", fight_type[0].text.strip())[0]
-            except:
-                return ""
+        match = WEIGHT_RE.search(text)
+        return match.group() if match else ""
 
     
 class FightScraper(BaseFightScraper):
@@ -192,7 +251,6 @@ class FightScraper(BaseFightScraper):
         "scores_2": pd.Int64Dtype(),
     }
     sort_fields = ["event_id", "fight_id"]
-    data = pd.DataFrame({col: pd.Series(dtype=dt) for col, dt in dtypes.items()})
     filename = "fight_data.csv"
 
     def __init__(self, *args: Any, **kwargs: Any) -> None:
@@ -216,137 +274,176 @@ class FightScraper(BaseFightScraper):
             get_all_events: If False, only scrapes fights from events not
                 already scraped.
         """
-        existing_urls = set(map(self.url_from_id, self.data["fight_id"]))
-        ufcstats_fight_urls = self.get_fight_urls(get_all_events)
-        urls_to_scrape = set(ufcstats_fight_urls) - existing_urls
-
-        logger.info(f"Opening round information to scrape stats")
-        rounds_handler = RoundsHandler(self.data_folder)
+        existing_ids = set(self.data["fight_id"])
+        urls_to_scrape = {
+            url
+            for url in self.get_fight_urls(get_all_events)
+            if self.id_from_url(url) not in existing_ids
+        }
 
         logger.info(f"Scraping {len(urls_to_scrape)} fights...")
 
         with (
-            open(self.data_file, "a") as f_fights,
-            open(rounds_handler.data_file, "a+") as f_rounds,
+            open(
+                self.data_file, "a", buffering=WRITE_BUFFER_SIZE, newline=""
+            ) as f_fights,
+            open(
+                self.rounds_handler.data_file,
+                "a",
+                buffering=WRITE_BUFFER_SIZE,
+                newline="",
+            ) as f_rounds,
         ):
             writer_fights = csv.writer(f_fights)
             writer_rounds = csv.writer(f_rounds)
 
-            for i, (url, soup) in enumerate(
-                links_to_soups(list(urls_to_scrape), self.n_sessions, self.delay)
+            fight_rows: List[List[Any]] = []
+            round_rows: List[Tuple[Any, ...]] = []
+
+            def write_rows() -> None:
+                # I am saving first the rounds and then the fights
+                # in case of error the fight doesn't count as scraped
+                writer_rounds.writerows(round_rows)
+                writer_fights.writerows(fight_rows)
+                round_rows.clear()
+                fight_rows.clear()
+
+            for i, (url, html) in enumerate(
+                links_to_htmls(list(urls_to_scrape), self.n_sessions, self.delay)
             ):
                 try:
-                    overview = soup.select("i.b-fight-details__text-item")
-                    select_result = soup.select("i.b-fight-details__text-item_first")
-                    select_result_details = soup.select("p.b-fight-details__text")
-                    fight_details = soup.select("p.b-fight-details__table-text")
-                    fight_type = soup.select("i.b-fight-details__fight-title")
-                    win_lose = soup.select("i.b-fight-details__person-status")
+                    fight_row, fight_round_rows = self.parse_fight(url, html)
+                except Exception as e:
+                    logger.error(f"Error saving data from url: {url}\nError: {e}")
+                    continue
 
-                    if soup.h2 is not None:
-                        event_id = self.event_scraper.id_from_url(
-                            str(soup.h2.select("a.b-link")[0]["href"])
-                        )
-                    else:
-                        raise TypeError("Couldn't find header in the soup.")
+                round_rows.extend(fight_round_rows)
+                fight_rows.append(fight_row)
+                logger.info(f"Scraped {i+1}/{len(urls_to_scrape)} fights...")
 
-                    referee = self.get_referee(overview)
-                    fighter_1, fighter_2 = self.get_fighters(fight_details, soup)
-                    num_rounds = overview[2].text.split(":")[1].strip()[0].strip()
-                    num_rounds = str(int(num_rounds)) if num_rounds != "N" else ""
-                    title_fight = self.get_title_fight(fight_type)
-                    weight_class = self.get_weight_class(fight_type)
-                    gender = self.get_gender(fight_type)
-                    result, result_details = self.get_result(
-                        select_result, select_result_details
-                    )
-                    finish_round = int(overview[0].text.split(":")[1].strip())
-                    finish_time = re.findall(r"\d:\d\d", overview[1].text)[0]
-                    winner = self.get_winner(fighter_1, fighter_2, win_lose)
-                    time_format = overview[2].text.split(":")[1].strip()
-                    fight_id = self.id_from_url(url)
-                    scores_1, scores_2 = self.get_scores(
-                        overview, select_result, select_result_details
-                    )
+                if len(fight_rows) >= WRITE_BATCH_SIZE:
+                    write_rows()
 
-                    # Correctly assign winner, in UFCStats winner is the scores_2
-                    # always...
-                    # I also need to flip in case of tie (right score for the higher
-                    # ranked)
-                    if winner != fighter_2:
-                        scores_1, scores_2 = scores_2, scores_1
-
-                    # I am saving first the rounds and then the fights
-                    # in case of error the fight doesn't count as scraped
-                    fight_stats_select = soup.select("p.b-fight-details__table-text")
-                    for j, fighter_id in enumerate((fighter_1, fighter_2)):
-                        for round_ in range(1, finish_round + 1):
-                            stats = rounds_handler.get_stats(
-                                fight_stats_select,
-                                fighter=j,
-                                round_=round_,
-                                finish_round=finish_round,
-                            )
-
-                            writer_rounds.writerow(
-                                (fight_id, fighter_id, round_) + stats
-                            )
-
-                    writer_fights.writerow(
-                        [
-                            fight_id,
-                            event_id,
-                            referee.strip(),
-                            fighter_1,
-                            fighter_2,
-                            winner.strip(),
-                            num_rounds,
-                            title_fight,
-                            weight_class,
-                            gender,
-                            result.strip(),
-                            result_details.strip(),
-                            finish_round,
-                            finish_time.strip(),
-                            time_format.strip(),
-                            scores_1,
-                            scores_2,
-                        ]
-                    )
-
-                    logger.info(f"Scraped {i+1}/{len(urls_to_scrape)} fights...")
-                except Exception as e:
-                    logger.error(f"Error saving data from url: {url}\nError: {e}")
+            write_rows()
 
         self.remove_duplicates_from_file()
         self.rounds_handler.remove_duplicates_from_file()
 
+    def parse_fight(self, url: str, html: bytes) -> ParsedFight:
+        """Extracts the fight details and round statistics from a fight page.
+
+        Args:
+            url: The URL of the fight page.
+            html: The HTML content of the fight page.
+
+        Returns:
+            A tuple with the row for the fights table and the rows for the
+            rounds table.
+
+        Raises:
+            TypeError: If the page has no header with the event link.
+        """
+        soup = bs4.BeautifulSoup(html, "lxml", parse_only=FIGHT_PAGE_CONTENT)
+
+        overview = OVERVIEW.select(soup)
+        select_result = RESULT.select(soup)
+        select_result_details = RESULT_DETAILS.select(soup)
+        fight_details = FIGHT_DETAILS.select(soup)
+        fight_type = FIGHT_TYPE.select(soup)
+        win_lose = WIN_LOSE.select(soup)
+
+        if soup.h2 is not None:
+            event_id = self.event_scraper.id_from_url(
+                str(EVENT_LINK.select(soup.h2)[0]["href"])
+            )
+        else:
+            raise TypeError("Couldn't find header in the soup.")
+
+        referee = self.get_referee(overview)
+        fighter_1, fighter_2 = self.get_fighters(fight_details, soup)
+        time_format = overview[2].text.partition(":")[2].strip()
+        num_rounds = time_format[0].strip()
+        num_rounds = str(int(num_rounds)) if num_rounds != "N" else ""
+        title_fight = self.get_title_fight(fight_type)
+        weight_class = self.get_weight_class(fight_type)
+        gender = self.get_gender(fight_type)
+        result, result_details = self.get_result(select_result, select_result_details)
+        finish_round = int(overview[0].text.partition(":")[2].strip())
+        finish_time = TIME_RE.findall(overview[1].text)[0]
+        winner = self.get_winner(fighter_1, fighter_2, win_lose)
+        fight_id = self.id_from_url(url)
+        scores_1, scores_2 = self.get_scores(
+            overview, select_result, select_result_details
+        )
+
+        # Correctly assign winner, in UFCStats winner is the scores_2
+        # always...
+        # I also need to flip in case of tie (right score for the higher
+        # ranked)
+        if winner != fighter_2:
+            scores_1, scores_2 = scores_2, scores_1
+
+        round_rows = []
+        for j, fighter_id in enumerate((fighter_1, fighter_2)):
+            for round_ in range(1, finish_round + 1):
+                stats = RoundsHandler.get_stats(
+                    fight_details,
+                    fighter=j,
+                    round_=round_,
+                    finish_round=finish_round,
+                )
+
+                round_rows.append((fight_id, fighter_id, round_) + stats)
+
+        fight_row = [
+            fight_id,
+            event_id,
+            referee.strip(),
+            fighter_1,
+            fighter_2,
+            winner.strip(),
+            num_rounds,
+            title_fight,
+            weight_class,
+            gender,
+            result.strip(),
+            result_details.strip(),
+            finish_round,
+            finish_time.strip(),
+            time_format.strip(),
+            scores_1,
+            scores_2,
+        ]
+
+        return fight_row, round_rows
+
     @staticmethod
-    def get_referee(overview: bs4.element.ResultSet) -> str:
+    def get_referee(overview: List[bs4.element.Tag]) -> str:
         """Extracts the referee's name from the fight overview.
 
         Args:
-            overview: A ResultSet containing fight overview information.
+            overview: The elements containing fight overview information.
 
         Returns:
             The referee's name, or '' if not found.
         """
-        try:
-            return overview[3].text.split(":")[1]
-        except:
+        if len(overview) < 4:
             return ""
 
+        _, separator, referee = overview[3].text.partition(":")
+        return referee if separator else ""
+
     # Scrape name of winner
     @staticmethod
     def get_winner(
-        fighter_1: str, fighter_2: str, win_lose: bs4.element.ResultSet
+        fighter_1: str, fighter_2: str, win_lose: List[bs4.element.Tag]
     ) -> str:
         """Determines the winner of the fight based on the win/lose status.
 
         Args:
             fighter_1: The ID of the first fighter.
             fighter_2: The ID of the second fighter.
-            win_lose: A ResultSet containing win/lose status for the fighters.
+            win_lose: The elements containing win/lose status for the fighters.
 
         Returns:
             The ID of the winner, or 'Draw' if it's a draw, or 'NC if no contest
@@ -368,11 +465,11 @@ class FightScraper(BaseFightScraper):
 
     # Checks gender of fight
     @staticmethod
-    def get_gender(fight_type: bs4.element.ResultSet) -> str:
+    def get_gender(fight_type: List[bs4.element.Tag]) -> str:
         """Determines the gender of the fight.
 
         Args:
-            fight_type: A ResultSet containing fight type information.
+            fight_type: The elements containing fight type information.
 
         Returns:
             'F' if it's a women's fight, 'M' otherwise.
@@ -385,27 +482,26 @@ class FightScraper(BaseFightScraper):
     # Scrapes the way the fight ended (e.g. KO, decision, etc.)
     @staticmethod
     def get_result(
-        select_result: bs4.element.ResultSet,
-        select_result_details: bs4.element.ResultSet,
+        select_result: List[bs4.element.Tag],
+        select_result_details: List[bs4.element.Tag],
     ) -> Tuple[str, str]:
         """
         Extracts the result and details of the fight.
 
         Args:
-            select_result: A ResultSet containing the fight result.
-            select_result_details: A ResultSet containing additional result details.
+            select_result: The elements containing the fight result.
+            select_result_details: The elements containing additional result details.
 
         Returns:
             A tuple with the result type and result details.
         """
-        if "Decision" in select_result[0].text.split(":")[1]:
-            return (
-                select_result[0].text.split(":")[1].split()[0],
-                select_result[0].text.split(":")[1].split()[-1],
-            )
+        result = select_result[0].text.partition(":")[2]
+
+        if "Decision" in result:
+            words = result.split()
+            return words[0], words[-1]
         else:
-            result = select_result[0].text.split(":")[1]
-            result_details = select_result_details[1].text.split(":")[-1]
+            result_details = select_result_details[1].text.rpartition(":")[2]
 
             if result_details.count("-") >= 3:
                 # This is the case of an overturned decision where the
@@ -421,37 +517,34 @@ class FightScraper(BaseFightScraper):
 
     @staticmethod
     def get_scores(
-        overview: bs4.element.ResultSet,
-        select_result: bs4.element.ResultSet,
-        select_result_details: bs4.element.ResultSet,
+        overview: List[bs4.element.Tag],
+        select_result: List[bs4.element.Tag],
+        select_result_details: List[bs4.element.Tag],
     ) -> Tuple[str, str]:
         """
         Extracts the scores of the fight if they the fight went the distance.
 
         Args:
-            overview: A ResultSet containing the fight overview.
-            select_result: A ResultSet containing the fight result.
+            overview: The elements containing the fight overview.
+            select_result: The elements containing the fight result.
 
         Returns:
             A tuple with the scores of the fight. As str to be
             written to the CSV file.
 
         """
-        result_details = select_result_details[1].text.split(":")[-1]
+        result_details = select_result_details[1].text.rpartition(":")[2]
 
-        if ("Decision" in select_result[0].text.split(":")[1]) or (
+        if ("Decision" in select_result[0].text.partition(":")[2]) or (
             result_details.count("-") >= 3
         ):
             # Initialize a list to hold the extracted scores
             scores = []
 
-            # Define the regex pattern for capturing the scores (e.g., 27 - 30, 28 - 29, etc.)
-            score_pattern = re.compile(r"(\d{1,2})\s*-\s*(\d{1,2})\.")
-
             # Iterate over the selected elements and check for score patterns
             for detail in overview:
                 text = detail.get_text(strip=True)
-                matches = score_pattern.findall(text)  # Find all matches in the text
+                matches = SCORE_RE.findall(text)  # Find all matches in the text
                 for match in matches:
                     scores.append(match)  # Append each found score to the list
 
@@ -482,7 +575,6 @@ class UpcomingFightScraper(BaseFightScraper):
         "weight_class": str,
     }
     sort_fields = ["event_id", "fight_id"]
-    data = pd.DataFrame({col: pd.Series(dtype=dt) for col, dt in dtypes.items()})
     filename = "upcoming_fight_data.csv"
     event_scraper = UpcomingEventScraper
 
@@ -491,30 +583,38 @@ class UpcomingFightScraper(BaseFightScraper):
 
         This method scrapes fight details and saves them to a CSV file.
         """
-        existing_urls = set(map(self.url_from_id, self.data["fight_id"]))
-        ufcstats_fight_urls = set(self.get_fight_urls(get_all_events=True))
-
-        urls_to_scrape = ufcstats_fight_urls - existing_urls
-        urls_to_remove = existing_urls - ufcstats_fight_urls
-
-        if urls_to_remove:
-            logger.info(f"Removing {len(urls_to_remove)} outdated fight URLs...")
-            self.remove_rows_from_table(list(urls_to_remove))
+        existing_ids = set(self.data["fight_id"])
+        ufcstats_fight_urls = {
+            self.id_from_url(url): url
+            for url in self.get_fight_urls(get_all_events=True)
+        }
+
+        urls_to_scrape = {
+            url for id_, url in ufcstats_fight_urls.items() if id_ not in existing_ids
+        }
+        ids_to_remove = existing_ids - ufcstats_fight_urls.keys()
+
+        if ids_to_remove:
+            logger.info(f"Removing {len(ids_to_remove)} outdated fights...")
+            self.remove_rows_from_table(list(ids_to_remove))
         
         logger.info(f"Scraping {len(urls_to_scrape)} fights...")
 
-        with open(self.data_file, "a") as f_fights:
+        with open(
+            self.data_file, "a", buffering=WRITE_BUFFER_SIZE, newline=""
+        ) as f_fights:
             writer = csv.writer(f_fights)
-            for i, (url, soup) in enumerate(
-                links_to_soups(list(urls_to_scrape), self.n_sessions, self.delay)
+            for i, (url, html) in enumerate(
+                links_to_htmls(list(urls_to_scrape), self.n_sessions, self.delay)
             ):
+                soup = bs4.BeautifulSoup(html, "lxml")
                 try:
-                    fight_details = soup.select("p.b-fight-details__table-text")
-                    fight_type = soup.select("i.b-fight-details__fight-title")
+                    fight_details = FIGHT_DETAILS.select(soup)
+                    fight_type = FIGHT_TYPE.select(soup)
 
                     if soup.h2 is not None:
                         event_id = self.event_scraper.id_from_url(
-                            str(soup.h2.select("a.b-link")[0]["href"])
+                            str(EVENT_LINK.select(soup.h2)[0]["href"])
                         )
                     else:
                         raise TypeError("Couldn't find header in the soup.")
@@ -580,25 +680,24 @@ class RoundsHandler(BaseFileHandler):
         "ctrl_time": str,
     }
     sort_fields = ["fight_id", "fighter_id", "round"]
-    data = pd.DataFrame({col: pd.Series(dtype=dt) for col, dt in dtypes.items()})
     filename = "round_data.csv"
 
     @staticmethod
     def get_stats(
-        fight_stats: bs4.element.ResultSet, fighter: int, round_: int, finish_round: int
+        fight_stats: List[bs4.element.Tag], fighter: int, round_: int, finish_round: int
     ) -> Tuple[str, ...]:
         """
         Extracts round statistics for a specific fighter in a given fight.
 
         Args:
-            fight_stats: A ResultSet containing fight statistics.
+            fight_stats: The elements containing fight statistics.
             fighter: The index of the fighter (0 or 1).
             round_: The round number.
             finish_round: The total number of rounds.
 
         Returns:
             A tuple of statistics for the specified fighter in the given round.
-            Returns "" for all fields if an error occurs.
+            Returns "" for all fields if the statistics are missing or malformed.
 
         Raises:
             ValueError: If `fighter` is not 0 or 1.
@@ -612,34 +711,61 @@ class RoundsHandler(BaseFileHandler):
         if fighter == 1:
             shift_general += 1
             shift_striking += 1
-        try:
-            data = (
-                fight_stats[2 + shift_general].text,  # knockdowns
-                fight_stats[2 + shift_striking].text.split(" of ")[
-                    1
-                ],  # Significant strikes
-                fight_stats[2 + shift_striking].text.split(" of ")[0],
-                fight_stats[6 + shift_striking].text.split(" of ")[1],  # Head
-                fight_stats[6 + shift_striking].text.split(" of ")[0],
-                fight_stats[8 + shift_striking].text.split(" of ")[1],  # Body
-                fight_stats[8 + shift_striking].text.split(" of ")[0],
-                fight_stats[10 + shift_striking].text.split(" of ")[1],  # Leg
-                fight_stats[10 + shift_striking].text.split(" of ")[0],
-                fight_stats[12 + shift_striking].text.split(" of ")[1],  # Distance
-                fight_stats[12 + shift_striking].text.split(" of ")[0],
-                fight_stats[16 + shift_striking].text.split(" of ")[1],  # Ground
-                fight_stats[16 + shift_striking].text.split(" of ")[0],
-                fight_stats[14 + shift_striking].text.split(" of ")[1],  # Clinch
-                fight_stats[14 + shift_striking].text.split(" of ")[0],
-                fight_stats[8 + shift_general].text.split(" of ")[1],  # Total strikes
-                fight_stats[8 + shift_general].text.split(" of ")[0],
-                fight_stats[10 + shift_general].text.split(" of ")[1],  # Takedown
-                fight_stats[10 + shift_general].text.split(" of ")[0],
-                fight_stats[14 + shift_general].text,  # Submission attempts
-                fight_stats[16 + shift_general].text,  # Reversals
-                fight_stats[18 + shift_general].text,  # Control time
-            )
 
-            return tuple(datum.strip() for datum in data)
-        except:
+        if len(fight_stats) <= max(18 + shift_general, 16 + shift_striking):
             return ("",) * 22
+
+        # Each cell is read once, "X of Y" cells are split once.
+        knockdowns, total, takedown, submissions, reversals, ctrl_time = (
+            fight_stats[i + shift_general].text for i in (2, 8, 10, 14, 16, 18)
+        )
+        landed_of_attempted = [
+            text.partition(" of ")
+            for text in [
+                *(
+                    fight_stats[i + shift_striking].text
+                    for i in (2, 6, 8, 10, 12, 14, 16)
+                ),
+                total,
+                takedown,
+            ]
+        ]
+        if not all(separator for _, separator, _ in landed_of_attempted):
+            return ("",) * 22
+
+        (
+            significant,
+            head,
+            body,
+            leg,
+            distance,
+            clinch,
+            ground,
+            total_strikes,
+            takedowns,
+        ) = landed_of_attempted
+
+        return (
+            knockdowns.strip(),  # knockdowns
+            significant[2].strip(),  # Significant strikes
+            significant[0].strip(),
+            head[2].strip(),  # Head
+            head[0].strip(),
+            body[2].strip(),  # Body
+            body[0].strip(),
+            leg[2].strip(),  # Leg
+            leg[0].strip(),
+            distance[2].strip(),  # Distance
+            distance[0].strip(),
+            ground[2].strip(),  # Ground
+            ground[0].strip(),
+            clinch[2].strip(),  # Clinch
+            clinch[0].strip(),
+            total_strikes[2].strip(),  # Total strikes
+            total_strikes[0].strip(),
+            takedowns[2].strip(),  # Takedown
+            takedowns[0].strip(),
+            submissions.strip(),  # Submission attempts
+            reversals.strip(),  # Reversals
+            ctrl_time.strip(),  # Control time
+        )
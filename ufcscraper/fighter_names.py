@@ -23,6 +23,7 @@ from ufcscraper.base import BaseFileHandler
 from ufcscraper.ufc_scraper import UFCScraper
 
 if TYPE_CHECKING:  # pragma: no cover
+    from pathlib import Path
     from typing import Dict, Optional
 
 logger = logging.getLogger(__name__)
@@ -43,9 +44,23 @@ class FighterNames(BaseFileHandler):
         "database_id": str,
     }
     sort_fields = ["database", "name", "fighter_id"]
-    data = pd.DataFrame({col: pd.Series(dtype=dt) for col, dt in dtypes.items()})
     filename = "fighter_names.csv"
 
+    # database -> records split and the data it was built from
+    database_records: Dict[str, pd.DataFrame]
+    database_records_source: Optional[pd.DataFrame]
+
+    def __init__(self, data_folder: Path | str):
+        """Initializes the FighterNames with the specified data folder.
+
+        Args:
+            data_folder (Path | str): The folder where the CSV file is stored
+            or will be created.
+        """
+        self.database_records = {}
+        self.database_records_source = None
+        super().__init__(data_folder)
+
     def check_missing_records(self) -> None:
         """Check for missing records in the UFCStats data.
 
@@ -56,9 +71,7 @@ class FighterNames(BaseFileHandler):
         ufc_stats_data = self.get_ufcstats_data()
 
         # Remove existing records from dataframe
-        existing_records = self.data[self.data["database"] == "UFCStats"][
-            "fighter_id"
-        ].tolist()
+        existing_records = set(self.get_database_records("UFCStats")["fighter_id"])
 
         missing_records = ufc_stats_data[
             ~ufc_stats_data["fighter_id"].isin(existing_records)
@@ -97,6 +110,27 @@ class FighterNames(BaseFileHandler):
         else:
             return None
 
+    def get_database_records(self, database: str) -> pd.DataFrame:
+        """Get the records associated with a given database.
+
+        The data is split by database in a single pass, and the split is
+        cached until the `data` attribute is replaced (e.g. by `load_data`).
+
+        Args:
+            database: Name of the database.
+
+        Returns:
+            DataFrame with the records of the database, empty if there
+            are none.
+        """
+        if self.database_records_source is not self.data:
+            self.database_records = dict(
+                list(self.data.groupby("database", sort=False))
+            )
+            self.database_records_source = self.data
+
+        return self.database_records.get(database, self.data.iloc[0:0])
+
     def fighter_in_database(
         self, fighter_id: str, database: str, name: str, database_id: str
     ) -> bool:
@@ -141,16 +175,14 @@ class FighterNames(BaseFileHandler):
         fighters_object.add_name_column()
         fighters = fighters_object.data
 
-        data = pd.concat(
-            [
-                fights.rename(
-                    columns={"fighter_1": "opponent_id", "fighter_2": "fighter_id"}
-                ),
-                fights.rename(
-                    columns={"fighter_2": "opponent_id", "fighter_1": "fighter_id"}
-                ),
-            ]
+        # Each fight appears twice, once from the point of view of each fighter
+        data = (
+            fights.drop(columns=["fighter_1", "fighter_2"])
+            .iloc[pd.RangeIndex(len(fights)).repeat(2)]
+            .reset_index(drop=True)
         )
+        data["fighter_id"] = fights[["fighter_2", "fighter_1"]].to_numpy().ravel()
+        data["opponent_id"] = fights[["fighter_1", "fighter_2"]].to_numpy().ravel()
 
         fighter_fields = ["fighter_id", "fighter_name", "fighter_nickname"]
         data = data.merge(
@@ -17,17 +17,32 @@ import datetime
 import logging
 from typing import TYPE_CHECKING
 
+import bs4
 import pandas as pd
+import soupsieve as sv
 
-from ufcscraper.base import BaseScraper
-from ufcscraper.utils import links_to_soups
+from ufcscraper.base import WRITE_BUFFER_SIZE, BaseScraper
+from ufcscraper.utils import links_to_htmls
 
 if TYPE_CHECKING:  # pragma: no cover
-    import bs4
     from typing import Dict, List
 
 logger = logging.getLogger(__name__)
 
+# CSS selectors used on every fighter page, compiled once.
+NAME = sv.compile("span")
+NICKNAME = sv.compile("p.b-content__Nickname")
+DETAILS = sv.compile("li.b-list__box-list-item")
+RECORD = sv.compile("span.b-content__title-record")
+
+# Month abbreviations used by UFCStats dates (e.g. "Jul 22, 1989").
+MONTHS = {
+    month: number
+    for number, month in enumerate(
+        "Jan Feb Mar Apr May Jun Jul Aug Sep Oct Nov Dec".split(), start=1
+    )
+}
+
 
 class FighterScraper(BaseScraper):
     """Scrapes and stores fighter data from UFCStats.
@@ -53,7 +68,6 @@ class FighterScraper(BaseScraper):
         "fighter_nc_dq": pd.Int64Dtype(),
     }
     sort_fields = ["fighter_l_name", "fighter_f_name", "fighter_id"]
-    data = pd.DataFrame({col: pd.Series(dtype=dt) for col, dt in dtypes.items()})
     filename = "fighter_data.csv"
 
     @classmethod
@@ -74,25 +88,33 @@ class FighterScraper(BaseScraper):
         This method retrieves fighter URLs, scrapes details from each URL,
         and appends the data to the CSV file. Handles errors and logs progress.
         """
-        existing_urls = set(map(self.url_from_id, self.data["fighter_id"]))
-        ufcstats_fighter_urls = self.get_fighter_urls()
-        urls_to_scrape = set(ufcstats_fighter_urls) - existing_urls
+        existing_ids = set(self.data["fighter_id"])
+        urls_to_scrape = {
+            url
+            for url in self.get_fighter_urls()
+            if self.id_from_url(url) not in existing_ids
+        }
 
         logger.info(f"Scraping {len(urls_to_scrape)} fighters...")
 
-        with open(self.data_file, "a+") as f:
+        with open(
+            self.data_file, "a", buffering=WRITE_BUFFER_SIZE, newline=""
+        ) as f:
             writer = csv.writer(f)
 
-            for i, (url, soup) in enumerate(
-                links_to_soups(list(urls_to_scrape), self.n_sessions, self.delay)
+            for i, (url, html) in enumerate(
+                links_to_htmls(list(urls_to_scrape), self.n_sessions, self.delay)
             ):
+                soup = bs4.BeautifulSoup(html, "lxml")
                 try:
-                    name = soup.select("span")[0].text.split()
-                    nickname = soup.select("p.b-content__Nickname")[0]
-                    details = soup.select("li.b-list__box-list-item")
+                    # Only the first matches are used, the searches stop
+                    # as soon as they are found.
+                    name = NAME.select(soup, limit=1)[0].text.split()
+                    nickname = NICKNAME.select(soup, limit=1)[0]
+                    details = DETAILS.select(soup, limit=5)
                     record = (
-                        soup.select("span.b-content__title-record")[0]
-                        .text.split(":")[1]
+                        RECORD.select(soup, limit=1)[0]
+                        .text.partition(":")[2]
                         .strip()
                         .split("-")
                     )
@@ -142,8 +164,10 @@ class FighterScraper(BaseScraper):
             and last names.
         """
         self.data["fighter_name"] = (
-            self.data["fighter_f_name"] + " " + self.data["fighter_l_name"].fillna("")
-        ).str.strip()
+            self.data["fighter_f_name"]
+            .str.cat(self.data["fighter_l_name"], sep=" ", na_rep="")
+            .str.strip()
+        )
 
     def get_fighter_urls(self) -> List[str]:
         """
@@ -160,14 +184,14 @@ class FighterScraper(BaseScraper):
             for letter in "abcdefghijklmnopqrstuvwxyz"
         ]
 
-        soups = [result[1] for result in links_to_soups(urls, self.n_sessions)]
-
-        # Collect fighter URLs from each page
-        fighter_urls = []
-        for soup in soups:
-            if soup is not None:
-                for link in soup.select("a.b-link")[1::3]:
-                    fighter_urls.append(str(link.get("href")))
+        # Collect fighter URLs from each page, pages are parsed as they
+        # arrive and dropped afterwards so only the URLs are kept in memory.
+        fighter_urls: List[str] = []
+        for _, html in links_to_htmls(urls, self.n_sessions):
+            soup = bs4.BeautifulSoup(html, "lxml")
+            fighter_urls.extend(
+                str(link.get("href")) for link in soup.select("a.b-link")[1::3]
+            )
 
         logger.info(f"Got {len(fighter_urls)} urls...")
         return fighter_urls
@@ -221,7 +245,7 @@ class FighterScraper(BaseScraper):
         Returns:
             The height in centimeters, or "" if not available.
         """
-        height_text = height.text.split(":")[1].strip()
+        height_text = height.text.partition(":")[2].strip()
         if "--" in height_text.split("'"):
             return ""
         else:
@@ -241,7 +265,7 @@ class FighterScraper(BaseScraper):
         Returns:
             The reach in centimeters, or "" if not available.
         """
-        reach_text = reach.text.split(":")[1]
+        reach_text = reach.text.partition(":")[2]
         if "--" in reach_text:
             return ""
         else:
@@ -258,7 +282,7 @@ class FighterScraper(BaseScraper):
         Returns:
             The weight in pounds, or "" if not available.
         """
-        weight_text = weight_element.text.split(":")[1]
+        weight_text = weight_element.text.partition(":")[2]
         if "--" in weight_text:
             return ""
         else:
@@ -275,7 +299,7 @@ class FighterScraper(BaseScraper):
         Returns:
             The stance, or "" if not available.
         """
-        stance_text = stance.text.split(":")[1]
+        stance_text = stance.text.partition(":")[2]
         if stance_text == "":
             return ""
         else:
@@ -291,9 +315,17 @@ class FighterScraper(BaseScraper):
 
         Returns:
             The date of birth in YYYY-MM-DD format, or "" if not available.
+
+        Raises:
+            ValueError: If the date of birth is not in the "%b %d, %Y" format.
         """
-        dob_text = dob.text.split(":")[1].strip()
+        dob_text = dob.text.partition(":")[2].strip()
         if dob_text == "--":
             return ""
         else:
-            return str(datetime.datetime.strptime(dob_text, "%b %d, %Y"))[0:10]
+            # Faster than strptime for this fixed "%b %d, %Y" format
+            month, _, day_year = dob_text.partition(" ")
+            day, _, year = day_year.partition(", ")
+            if month not in MONTHS:
+                raise ValueError(f"Invalid date of birth: '{dob_text}'")
+            return datetime.date(int(year), MONTHS[month], int(day)).isoformat()
@@ -1,2 +1,26 @@
-from .bfo_scraper import BestFightOddsScraper
-from .bet365_odds_reader import Bet365OddsReader, Bet365Odds
+from __future__ import annotations
+
+from importlib import import_module
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:  # pragma: no cover
+    from typing import Any
+
+    from .bfo_scraper import BestFightOddsScraper
+    from .bet365_odds_reader import Bet365OddsReader, Bet365Odds
+
+# Scrapers are imported on first access, so that reading Bet365 odds
+# does not need to import selenium and the BestFightOdds dependencies.
+_scraper_modules = {
+    "BestFightOddsScraper": ".bfo_scraper",
+    "Bet365OddsReader": ".bet365_odds_reader",
+    "Bet365Odds": ".bet365_odds_reader",
+}
+
+__all__ = list(_scraper_modules)
+
+
+def __getattr__(name: str) -> Any:
+    if name in _scraper_modules:
+        return getattr(import_module(_scraper_modules[name], __name__), name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
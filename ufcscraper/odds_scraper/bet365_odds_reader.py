@@ -8,20 +8,20 @@ Classes:
 
 from __future__ import annotations
 
-import csv
 from locale import setlocale, LC_TIME
 import logging
 from datetime import datetime
 from pathlib import Path
 from typing import TYPE_CHECKING, Tuple
 
-from fuzzywuzzy import fuzz
 import pandas as pd
-from bs4 import BeautifulSoup
+from lxml import etree, html
+from rapidfuzz import fuzz, process, utils
 
 from ufcscraper.base import BaseFileHandler, BaseHTMLReader
 from ufcscraper.fighter_names import FighterNames
 from ufcscraper.ufc_scraper import UFCScraper
+from ufcscraper.utils import xpath_with_class
 
 if TYPE_CHECKING:
     from typing import Dict, List
@@ -29,6 +29,20 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 
+
+# The HTML snapshots are saved as UTF-8, parsing the raw bytes avoids
+# decoding the whole file into a string first.
+HTML_PARSER = html.HTMLParser(encoding="utf-8")
+
+LAST_MARKET_GROUP = etree.XPath(
+    f"(//div[{xpath_with_class('gl-MarketGroupContainer')}])[last()]"
+)
+CHILD_DIVS = etree.XPath("./div")
+TEAM_WRAPPERS = etree.XPath(
+    f".//div[{xpath_with_class('src-ParticipantFixtureDetailsHigher_TeamWrapper')}]"
+)
+ODDS = etree.XPath(f"//span[{xpath_with_class('src-ParticipantOddsOnly50_Odds')}]")
+
 class Bet365Odds(BaseFileHandler):
     """
     Class to handle Bet365 odds data associated with existing fights.
@@ -36,13 +50,12 @@ class Bet365Odds(BaseFileHandler):
     
     dtypes: Dict[str, type | pd.core.arrays.integer.Int64Dtype] = {
         "scrape_datetime": "datetime64[ns]",
-        "fight_id": "datetime64[ns]",
+        "fight_id": str,
         "fighter_id": str,
         "odds": float,
     }
 
     sort_fields = ["scrape_datetime", "fight_id", "fighter_id", "odds"]
-    data = pd.DataFrame({col: pd.Series(dtype=dt) for col, dt in dtypes.items()})
     filename = "bet365_odds.csv"
 
 
@@ -55,7 +68,9 @@ class Bet365Odds(BaseFileHandler):
             min_match_score: Minimum fuzzy match score to consider a name match valid
         """
         scraper = UFCScraper(self.data_folder)
-        odds = pd.read_csv(self.data_folder / "bet365_odds_raw.csv")
+        odds = Bet365OddsReader.read_csv(
+            self.data_folder / Bet365OddsReader.filename
+        )
 
         fight_data = scraper.fight_scraper.data
         fighter_data = scraper.fighter_scraper.data
@@ -96,22 +111,25 @@ class Bet365Odds(BaseFileHandler):
             ]
         )
 
-        odds["fight_date"] = pd.to_datetime(odds["fight_date"])
-
-        # Map fight_dates to valid event_dates
-        unique_event_date = data["event_date"].unique()
-        date_mapping = {}
-        unmatched_dates = set()
-        for odd_date in pd.to_datetime(odds["fight_date"].unique()):
-            closest = min(unique_event_date, key=lambda d: abs(odd_date - d))
-            distance = abs(odd_date - closest).days
-
-            if distance <= max_date_diff_days:
-                date_mapping[odd_date] = closest
-            else:
-                unmatched_dates.add(odd_date)
+        # Map fight_dates to the closest valid event_dates, both sides are
+        # sorted so each fight_date is matched with a binary search.
+        closest_dates = pd.merge_asof(
+            odds[["fight_date"]].dropna().drop_duplicates().sort_values("fight_date"),
+            data[["event_date"]].dropna().drop_duplicates().sort_values("event_date"),
+            left_on="fight_date",
+            right_on="event_date",
+            direction="nearest",
+            tolerance=pd.Timedelta(days=max_date_diff_days),
+        )
+        matched = closest_dates["event_date"].notna()
+        date_mapping = dict(
+            zip(
+                closest_dates.loc[matched, "fight_date"],
+                closest_dates.loc[matched, "event_date"],
+            )
+        )
 
-        for unmatched_date in sorted(unmatched_dates):
+        for unmatched_date in closest_dates.loc[~matched, "fight_date"]:
             logger.warning(f"Unmatched fight at date {unmatched_date}")
 
         odds["fight_date"] = odds["fight_date"].map(date_mapping)
@@ -125,11 +143,31 @@ class Bet365Odds(BaseFileHandler):
             data,
             on="event_date",
         )
-        # Compute fuzzy match score
-        merged["match_score"] = merged.apply(
-            lambda row: fuzz.token_set_ratio(row["fighter_name"], row["fighter_full_name"]),
-            axis=1,
+        # Score every distinct pair of names once, in a single batch, each
+        # pair is repeated for all the odds rows of the same fighter.
+        odds_codes, odds_names = pd.factorize(
+            merged["fighter_name"], use_na_sentinel=False
         )
+        fighter_codes, fighter_names = pd.factorize(
+            merged["fighter_full_name"], use_na_sentinel=False
+        )
+        pair_codes, pairs = pd.factorize(
+            odds_codes * len(fighter_names) + fighter_codes
+        )
+        scores = process.cpdist(
+            [
+                name if isinstance(name, str) else None
+                for name in odds_names[pairs // len(fighter_names)]
+            ],
+            [
+                name if isinstance(name, str) else None
+                for name in fighter_names[pairs % len(fighter_names)]
+            ],
+            scorer=fuzz.token_set_ratio,
+            processor=utils.default_process,
+            workers=-1,
+        )
+        merged["match_score"] = scores[pair_codes]
         best_matches = merged.loc[merged.groupby("odds_row_id")["match_score"].idxmax()]
 
         below_threshold = best_matches["match_score"] < min_match_score
@@ -145,8 +183,6 @@ class Bet365Odds(BaseFileHandler):
             }
         )
 
-        final_data["scrape_datetime"] = pd.to_datetime(final_data["scrape_datetime"])
-
         final_data.to_csv(self.data_file, index=False)
         self.remove_duplicates_from_file()
         logger.info(f"Consolidated Bet365 odds data saved to {self.data_file}")
@@ -166,7 +202,6 @@ class Bet365OddsReader(BaseHTMLReader):
     }
 
     sort_fields = ["html_datetime", "fight_date", "fighter_name", "opponent_name", "fighter_odds", "opponent_odds"]
-    data = pd.DataFrame({col: pd.Series(dtype=dt) for col, dt in dtypes.items()})
     filename = "bet365_odds_raw.csv"
 
     def __init__(self, html_file: Path | str, data_folder: Path | str):
@@ -185,27 +220,27 @@ class Bet365OddsReader(BaseHTMLReader):
         """
         Scrapes the odds data from the HTML file and saves it to a CSV file.
         """
-        soup = BeautifulSoup(self.read_html(), "lxml")
-        table = soup.find_all("div", class_="gl-MarketGroupContainer")[-1]
-        rows = table.find_all("div", recursive=False)
+        tree = html.fromstring(self.html_file.read_bytes(), parser=HTML_PARSER)
+        table = LAST_MARKET_GROUP(tree)[0]
+        rows = CHILD_DIVS(table)
 
         database_length = len(self.data)
 
         fights: Dict[datetime, List[List[str]]] = {}
-        for elem in rows[0].find_all("div", recursive=False):
-            if not elem.text:
+        for elem in CHILD_DIVS(rows[0]):
+            text = elem.text_content()
+            if not text:
                 continue
 
-            elif "rcl-MarketHeaderLabel" in elem.get("class"):
+            elif "rcl-MarketHeaderLabel" in elem.get("class", "").split():
                 # Handle date header
-                datestr = elem.text
+                datestr = text
 
                 # Correct format adding year
-                if len(datestr.split(" ")) == 3:
+                n_fields = datestr.count(" ") + 1
+                if n_fields == 3:
                     datestr += " " + str(self.html_datetime.year)
-                elif len(datestr.split(" ")) == 4:
-                    pass
-                else:
+                elif n_fields != 4:
                     raise ValueError("Read invalid date format: ", datestr)
 
                 date = None
@@ -214,6 +249,7 @@ class Bet365OddsReader(BaseHTMLReader):
                         setlocale(LC_TIME, loc)
                         date = datetime.strptime(datestr, "%a %d %b %Y")
                         logger.debug(f"Parsed date '{datestr}' with locale '{loc}'")
+                        break
                     except ValueError:
                         pass
                 if date is None:
@@ -228,51 +264,42 @@ class Bet365OddsReader(BaseHTMLReader):
 
             else:
                 fighters = []
-                for fighter in elem.find_all(
-                    "div", class_="src-ParticipantFixtureDetailsHigher_TeamWrapper"
-                ):
-                    fighters.append(fighter.text.strip())
+                for fighter in TEAM_WRAPPERS(elem):
+                    fighters.append(fighter.text_content().strip())
 
                 if not date:
                     raise ValueError("No date found for fighters: ", fighters)
                 fights[date].append(fighters)
 
-        odds = []
-        for odd in soup.find_all("span", class_="src-ParticipantOddsOnly50_Odds"):
-            odds.append(odd.text.strip())
+        # Consecutive odds belong to the fighter and the opponent.
+        odds_iter = iter(odd.text_content().strip() for odd in ODDS(tree))
+        odds = zip(odds_iter, odds_iter)
 
-        odds = [odds[i : i + 2] for i in range(0, len(odds), 2)]
+        # The odds follow the same order as the fights, so both sequences
+        # are paired in a single pass without splitting the odds by date.
+        dated_fights = (
+            (date, fight) for date, date_fights in fights.items() for fight in date_fights
+        )
 
-        odds_dict = {}
-        i = 0
-        for key, val in fights.items():
-            n = len(val)
-            odds_dict[key] = odds[i : i + n]
-            i += n
-        
         # Prepare rows to be added
-        rows_to_add = []
-        for date in fights.keys():
-            for fight, odds in zip(fights[date], odds_dict[date]):
-                fighter, opponent = fight
-                fighter_odds, opponent_odds = odds
-                row = [
-                    self.html_datetime.strftime("%Y-%m-%d %H:%M:%S"),
-                    date.strftime("%Y-%m-%d"),
-                    fighter,
-                    opponent,
-                    fighter_odds,
-                    opponent_odds,
-                ]
-                rows_to_add.append(row)
+        html_datetime = self.html_datetime.strftime("%Y-%m-%d %H:%M:%S")
+        rows_to_add = [
+            (html_datetime, date, fighter, opponent, fighter_odds, opponent_odds)
+            for (date, (fighter, opponent)), (fighter_odds, opponent_odds) in zip(
+                dated_fights, odds
+            )
+        ]
 
         logger.info(f"Rows to be written: {len(rows_to_add)}")
 
-        with open(self.data_file, "a") as file:
-            writer = csv.writer(file)
-            for row in rows_to_add:
-                writer.writerow(row)
+        # Merge with the existing records in memory and write the table once,
+        # instead of appending and reading the whole file back.
+        new_data = pd.DataFrame(rows_to_add, columns=list(self.dtypes)).astype(
+            self.dtypes
+        )
+        data = pd.concat([self.data, new_data], ignore_index=True)
+        data = data[~data.duplicated()].sort_values(by=self.sort_fields)
+        data.to_csv(self.data_file, index=False)
 
-        self.remove_duplicates_from_file()
-        self.load_data()
+        self.data = data.reset_index(drop=True)
         logger.info(f"Rows added to database: {len(self.data) - database_length}")
\ No newline at end of file
@@ -17,24 +17,26 @@ from __future__ import annotations
 import csv
 import datetime
 import logging
-import multiprocessing
+import queue
 import time
 import urllib
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import TYPE_CHECKING
 
 import pandas as pd
 from bs4 import BeautifulSoup
-from fuzzywuzzy import fuzz, process
+from lxml import etree, html
+from rapidfuzz import fuzz, process, utils
 from selenium import webdriver
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.support.ui import WebDriverWait
 
-from ufcscraper.base import BaseScraper
+from ufcscraper.base import WRITE_BUFFER_SIZE, BaseScraper
 from ufcscraper.fighter_names import FighterNames
 from ufcscraper.ufc_scraper import UFCScraper
-from ufcscraper.utils import element_present_in_list, parse_date
+from ufcscraper.utils import element_present_in_list, parse_date, xpath_with_class
 
 if TYPE_CHECKING:  # pragma: no cover
     import datetime
@@ -42,6 +44,11 @@ if TYPE_CHECKING:  # pragma: no cover
 
 logger = logging.getLogger(__name__)
 
+TABLE_ROWS = etree.XPath("//tr")
+FIRST_LINK = etree.XPath("(.//a)[1]")
+EVENT_DATE = etree.XPath(f"(.//*[{xpath_with_class('item-non-mobile')}])[1]")
+MONEYLINES = etree.XPath(f".//td[{xpath_with_class('moneyline')}]")
+
 
 class BestFightOddsScraper(BaseScraper):
     """A scraper for Best Fight Odds data.
@@ -65,7 +72,6 @@ class BestFightOddsScraper(BaseScraper):
         "closing_range_max": pd.Int64Dtype(),
     }
     sort_fields = ["fight_id", "fighter_id"]
-    data = pd.DataFrame({col: pd.Series(dtype=dt) for col, dt in dtypes.items()})
     filename = "BestFightOdds_odds.csv"
     n_sessions = 1  # New default value
     min_score = 90
@@ -98,7 +104,7 @@ class BestFightOddsScraper(BaseScraper):
         super().__init__(data_folder, n_sessions, delay)
 
         # For this scraper it is better to not continuously reload the driver
-        self.drivers = [webdriver.Chrome() for _ in range(self.n_sessions)]
+        self.drivers = [self.create_driver() for _ in range(self.n_sessions)]
         self.fighter_names = FighterNames(self.data_folder)
         self.min_score = min_score or self.min_score
         self.min_date = min_date
@@ -137,13 +143,46 @@ class BestFightOddsScraper(BaseScraper):
                 return True
         return False
 
+    @staticmethod
+    def create_driver() -> webdriver.Chrome:
+        """Start a new web driver.
+
+        Returns:
+            The web driver instance.
+        """
+        return webdriver.Chrome()
+
+    @classmethod
+    def reset_driver(cls, driver: webdriver.Chrome) -> webdriver.Chrome:
+        """Reset the state of a web driver after a failed attempt.
+
+        The browser is kept open and only its page and cookies are
+        cleared, a new browser is only started if the current one
+        is not responding.
+
+        Args:
+            driver: The web driver instance.
+
+        Returns:
+            The web driver instance to use from now on.
+        """
+        try:
+            driver.get("about:blank")
+            driver.delete_all_cookies()
+            return driver
+        except Exception as e:
+            logger.error(f"Unable to reset driver, restarting it: {e}")
+            try:
+                driver.quit()
+            except Exception:
+                pass
+            return cls.create_driver()
+
     @classmethod
     def worker_constructor_target(
         cls,
         method: Callable[..., Any],
-    ) -> Callable[
-        [multiprocessing.Queue, multiprocessing.Queue, webdriver.Chrome], None
-    ]:
+    ) -> Callable[[queue.Queue, queue.Queue, webdriver.Chrome], None]:
         """Construct the worker target function for parallel processing.
 
         Args:
@@ -155,8 +194,8 @@ class BestFightOddsScraper(BaseScraper):
         """
 
         def worker(
-            task_queue: multiprocessing.Queue,
-            result_queue: multiprocessing.Queue,
+            task_queue: queue.Queue,
+            result_queue: queue.Queue,
             driver: webdriver.Chrome,
         ) -> None:
             while True:
@@ -180,16 +219,14 @@ class BestFightOddsScraper(BaseScraper):
                             logging.exception("Exception occurred")
 
                             # Reset the driver after a failed attempt
-                            driver.quit()
-                            driver = webdriver.Chrome()
+                            driver = cls.reset_driver(driver)
 
                 except Exception as e:
                     logging.error(f"Error processing task {task}: {e}")
                     logging.exception("Exception ocurred")
 
                     # Reset the driver after a failed attempt
-                    driver.quit()
-                    driver = webdriver.Chrome()
+                    driver = cls.reset_driver(driver)
 
                     # Send None to the result because task failed
                     result_queue.put(None)
@@ -254,7 +291,11 @@ class BestFightOddsScraper(BaseScraper):
         # We may have multiple ids for the fighter, we should
         # try all of them
         for fighter_BFO_id in fighter_BFO_ids + new_ids:
-            driver.get(self.url_from_id(fighter_BFO_id))
+            # A successful search already leaves the driver on the profile
+            profile_url = self.url_from_id(fighter_BFO_id)
+            if driver.current_url != profile_url:
+                driver.get(profile_url)
+
             (
                 id_BFO_name,
                 id_dates,
@@ -290,22 +331,24 @@ class BestFightOddsScraper(BaseScraper):
         fighters_id: List[str],
         fighters_search_names: List[Set[str]],
         fighters_BFO_ids: List[Set[str]],
-    ) -> Tuple[
-        multiprocessing.Queue, multiprocessing.Queue, List[multiprocessing.Process]
-    ]:
+    ) -> Tuple[queue.Queue, queue.Queue, ThreadPoolExecutor]:
         """Scrape odds data in parallel from fighter profile URLs.
 
+        Each worker drives its own browser session, so the workers spend
+        their time waiting for the browser and run as threads of the
+        current process. This avoids pickling the drivers and the results.
+
         Args:
             fighters_id: List of fighter IDs.
             fighters_search_names: Search names to try for each fighter.
             fighters_BFO_ids: BestFightOdds known IDs for each fighter.
 
         Returns:
-            Tuple containing result queue, task queue, and list of worker
-            processes.
+            Tuple containing result queue, task queue, and the executor
+            running the workers.
         """
-        task_queue: multiprocessing.Queue = multiprocessing.Queue()
-        result_queue: multiprocessing.Queue = multiprocessing.Queue()
+        task_queue: queue.Queue = queue.Queue()
+        result_queue: queue.Queue = queue.Queue()
 
         # Adding tasks
         for (
@@ -324,18 +367,12 @@ class BestFightOddsScraper(BaseScraper):
         worker_target = self.worker_constructor_target(self.get_odds_from_profile_urls)
 
         # Starting workers
-        workers = [
-            multiprocessing.Process(
-                target=worker_target,
-                args=(task_queue, result_queue, driver),
-            )
-            for driver in self.drivers
-        ]
-        for worker in workers:
-            worker.start()
+        executor = ThreadPoolExecutor(max_workers=max(len(self.drivers), 1))
+        for driver in self.drivers:
+            executor.submit(worker_target, task_queue, result_queue, driver)
 
-        # Return queues and workers to handle outside of the function
-        return result_queue, task_queue, workers
+        # Return queues and executor to handle outside of the function
+        return result_queue, task_queue, executor
 
     @classmethod
     def extract_odds_from_fighter_profile(
@@ -373,13 +410,10 @@ class BestFightOddsScraper(BaseScraper):
                 logging.warning("Human recognition page detected, stalling...")
                 time.sleep(5)
 
-        # Extract table
-        soup = BeautifulSoup(
-            element.get_attribute("innerHTML"),
-            "html.parser",
-        )
+        # Extract table, the inner HTML doesn't include the table tag.
+        table = html.fromstring(f"<table>{element.get_attribute('innerHTML')}</table>")
 
-        rows = soup.find_all("tr")
+        rows = TABLE_ROWS(table)
 
         rows_f = rows[2::3]
         rows_s = rows[3::3]
@@ -393,20 +427,19 @@ class BestFightOddsScraper(BaseScraper):
         closing_range_min = []
         closing_range_max = []
 
-        fighter_name: str = rows_f[0].select_one("a").get_text(strip=True)
+        fighter_name: str = FIRST_LINK(rows_f[0])[0].text_content().strip()
 
         for row_f, row_s in zip(rows_f, rows_s):
-            date_string = row_s.find(class_="item-non-mobile").text
+            date_string = EVENT_DATE(row_s)[0].text_content()
             if date_string == "":
                 continue
             else:
                 date = parse_date(date_string)
 
-            opponent = row_s.select_one("a")
+            opponent = FIRST_LINK(row_s)[0]
 
-            moneyline_elements = row_f.find_all("td", class_="moneyline")
             moneyline_values = [
-                elem.get_text(strip=True) for elem in moneyline_elements
+                elem.text_content().strip() for elem in MONEYLINES(row_f)
             ]
 
             if moneyline_values[0] == "":
@@ -419,8 +452,8 @@ class BestFightOddsScraper(BaseScraper):
                 closing_range_max.append(moneyline_values[2])
 
             dates.append(date)
-            opponents_name.append(opponent.get_text(strip=True))
-            opponents_id.append(cls.id_from_url(opponent["href"]))
+            opponents_name.append(opponent.text_content().strip())
+            opponents_id.append(cls.id_from_url(opponent.get("href")))
 
         openings_int = list(map(lambda x: int(x) if x != "" else None, openings))
         closing_range_min_int = list(
@@ -503,25 +536,37 @@ class BestFightOddsScraper(BaseScraper):
         ):
             soup = BeautifulSoup(element.get_attribute("innerHTML"), "html.parser")
 
-            fighters_names = []
+            fighters_names: List[str] = []
             fighters_urls = []
+            # Position of the first result with each name
+            names_indices: Dict[str, int] = {}
 
             rows = soup.find_all("tr")
             for row in rows:
                 link_element = row.find("a")
                 if link_element:
+                    names_indices.setdefault(link_element.text, len(fighters_names))
                     fighters_names.append(link_element.text)
                     fighters_urls.append(link_element["href"])
 
-            best_name, score = process.extractOne(
-                search_fighter, fighters_names, scorer=fuzz.token_sort_ratio
-            )
+            match: Optional[Tuple[str, float, int]]
+            if search_fighter in names_indices:
+                # Identical names don't need fuzzy scoring.
+                match = (search_fighter, 100.0, names_indices[search_fighter])
+            else:
+                # Candidates below the minimum score are discarded by rapidfuzz
+                match = process.extractOne(
+                    search_fighter,
+                    fighters_names,
+                    scorer=fuzz.token_sort_ratio,
+                    processor=utils.default_process,
+                    score_cutoff=self.min_score,
+                )
 
-            if score > self.min_score:
+            if match is not None and match[1] > self.min_score:
+                best_name, score, best_index = match
                 logger.info(f"Found {best_name} ({search_fighter}) with score {score}")
-                fighter_url = (
-                    self.web_url + fighters_urls[fighters_names.index(best_name)]
-                )
+                fighter_url = self.web_url + fighters_urls[best_index]
                 driver.get(fighter_url)
 
                 return (best_name, fighter_url)
@@ -550,16 +595,14 @@ class BestFightOddsScraper(BaseScraper):
         fighters_object = ufc_stats_data.fighter_scraper
         fighters_object.add_name_column()
 
-        data = pd.concat(
-            [
-                fights.rename(
-                    columns={"fighter_1": "opponent_id", "fighter_2": "fighter_id"}
-                ),
-                fights.rename(
-                    columns={"fighter_2": "opponent_id", "fighter_1": "fighter_id"}
-                ),
-            ]
+        # Each fight appears twice, once from the point of view of each fighter
+        data = (
+            fights.drop(columns=["fighter_1", "fighter_2"])
+            .iloc[pd.RangeIndex(len(fights)).repeat(2)]
+            .reset_index(drop=True)
         )
+        data["fighter_id"] = fights[["fighter_2", "fighter_1"]].to_numpy().ravel()
+        data["opponent_id"] = fights[["fighter_1", "fighter_2"]].to_numpy().ravel()
 
         # Now with events to get dates
         data = data.merge(
@@ -568,10 +611,9 @@ class BestFightOddsScraper(BaseScraper):
             how="left",
         )[["fight_id", "event_id", "fighter_id", "opponent_id", "event_date"]]
 
-        data["event_date"] = pd.to_datetime(data["event_date"])
         logger.info("Applying date mask...")
         logger.info(f"Previous size: {len(data)}")
-        data = data[data["event_date"].dt.date >= self.min_date]
+        data = data[data["event_date"] >= pd.Timestamp(self.min_date)]
         logger.info(f"New size: {len(data)}")
 
         # aggregate fighter names, same id: list of names and list of urls.
@@ -637,18 +679,15 @@ class BestFightOddsScraper(BaseScraper):
             if "opponent_" + col not in data.columns:
                 data["opponent_" + col] = None
 
-        # Convert NaNs to list(None) to homogenize types
+        # Convert NaNs to empty lists to homogenize types
         for col in "BFO_names", "UFC_names", "BFO_database_ids", "UFC_database_ids":
-            data[col] = (
-                data[col]
-                .apply(lambda x: [] if not isinstance(x, list) and pd.isna(x) else x)
-                .values
-            )
-            data["opponent_" + col] = (
-                data["opponent_" + col]
-                .apply(lambda x: [] if not isinstance(x, list) and pd.isna(x) else x)
-                .values
-            )
+            for column in col, "opponent_" + col:
+                missing = data[column].isna()
+                if missing.any():
+                    data.loc[missing, column] = pd.Series(
+                        [[] for _ in range(missing.sum())],
+                        index=data.index[missing],
+                    )
 
         # Return just reorganizing fields
         return data[
@@ -696,6 +735,22 @@ class BestFightOddsScraper(BaseScraper):
             )
         )
 
+    @staticmethod
+    def normalize_name(name: str) -> str:
+        """Normalize a name for fuzzy matching.
+
+        The name is processed as in rapidfuzz's default processor and its
+        tokens are sorted, so that `fuzz.ratio` between normalized names
+        equals `fuzz.token_sort_ratio` between the original ones.
+
+        Args:
+            name: The name to normalize.
+
+        Returns:
+            The normalized name.
+        """
+        return " ".join(sorted(utils.default_process(name).split()))
+
     def extract_valid_fights_from_odds_data(
         self,
         fighter_missing_data: pd.DataFrame,
@@ -740,53 +795,79 @@ class BestFightOddsScraper(BaseScraper):
             closing_range_maxs,
         ) = odds_data
 
+        # Missing dates become NaT, which never falls in the date window
+        dates_index = pd.DatetimeIndex(dates)
+
+        # Names are normalized and their tokens sorted once here, so the
+        # token sort ratio reduces to a plain ratio between them.
+        normalized_opponents = [
+            self.normalize_name(name) for name in opponents_BFO_names
+        ]
+
         BFO_names: Set[Tuple[str, str, str]] = set()
         odds_records: List[List[str]] = []
-        for _, row in fighter_missing_data.iterrows():
-            date = row["event_date"].date()
+        for (
+            event_date,
+            fight_id,
+            fighter_id,
+            opponent_id,
+            UFC_names,
+            opponent_UFC_names,
+        ) in zip(
+            fighter_missing_data["event_date"],
+            fighter_missing_data["fight_id"],
+            fighter_missing_data["fighter_id"],
+            fighter_missing_data["opponent_id"],
+            fighter_missing_data["UFC_names"],
+            fighter_missing_data["opponent_UFC_names"],
+        ):
+            if not opponent_UFC_names:
+                logger.info(
+                    f"No UFCStats name for opponent {opponent_id} of "
+                    f"{fighter_id} in fight {fight_id}, skipping"
+                )
+                continue
 
-            candidates_indxs = [
-                i
-                for i, candidate_date in enumerate(dates)
-                if abs((candidate_date - date).days) <= 1.5
-            ]
+            date = event_date.date()
+            candidates_indxs = (
+                abs(dates_index - event_date) <= pd.Timedelta(days=1)
+            ).nonzero()[0]
 
             if len(candidates_indxs) == 0:
                 logger.info(
-                    f"Unable to find opponent {row['opponent_UFC_names'][0]} for "
-                    f"{row['UFC_names'][0]} on {date}"
+                    f"Unable to find opponent {opponent_UFC_names[0]} for "
+                    f"{UFC_names[0]} on {date}"
                 )
             else:
-                possible_opponents = [opponents_BFO_names[i] for i in candidates_indxs]
-
-                scores = [
-                    process.extractOne(
-                        opponent,
-                        possible_opponents,
-                        scorer=fuzz.token_sort_ratio,
-                    )
-                    for opponent in possible_opponents
+                possible_opponents = [
+                    normalized_opponents[i] for i in candidates_indxs
                 ]
 
-                best_name, score = max(scores, key=lambda x: x[1])
-
-                # Iterate to find the position of the match
-                # date and name
-                for best_index, (date_, name_) in enumerate(
-                    zip(dates, opponents_BFO_names)
-                ):
-                    if (abs((date - date_).days) <= 1.5) and name_ == best_name:
-                        break
+                # Match the UFC name of the opponent against the BFO names
+                # of the opponents fought around that date.
+                opponent_name = self.normalize_name(opponent_UFC_names[0])
+                match: Optional[Tuple[str, float, int]]
+                if opponent_name in possible_opponents:
+                    match = (
+                        opponent_name,
+                        100.0,
+                        possible_opponents.index(opponent_name),
+                    )
                 else:
-                    # Unable to find, let's set the score to 0
-                    # and nothing will be added
-                    score = 0
+                    match = process.extractOne(
+                        opponent_name,
+                        possible_opponents,
+                        scorer=fuzz.ratio,
+                        processor=None,
+                        score_cutoff=self.min_score,
+                    )
 
-                if score > self.min_score:
+                if match is not None and match[1] > self.min_score:
+                    best_index = candidates_indxs[match[2]]
                     odds_records.append(
                         [
-                            row["fight_id"],
-                            row["fighter_id"],
+                            fight_id,
+                            fighter_id,
                             openings[best_index],
                             closing_range_mins[best_index],
                             closing_range_maxs[best_index],
@@ -794,22 +875,22 @@ class BestFightOddsScraper(BaseScraper):
                     )
                     BFO_names.add(
                         (
-                            row["opponent_id"],
+                            opponent_id,
                             opponents_BFO_ids[best_index],
                             opponents_BFO_names[best_index],
                         )
                     )
                     BFO_names.add(
                         (
-                            row["fighter_id"],
+                            fighter_id,
                             fighter_BFO_ids[best_index],
                             fighter_BFO_names[best_index],
                         )
                     )
                 else:
                     logger.info(
-                        f"Unable to find opponent {row['opponent_UFC_names'][0]} for "
-                        f"{row['UFC_names'][0]} on {date}."
+                        f"Unable to find opponent {opponent_UFC_names[0]} for "
+                        f"{UFC_names[0]} on {date}."
                     )
 
         return odds_records, BFO_names
@@ -851,8 +932,8 @@ class BestFightOddsScraper(BaseScraper):
         bfo_ids = []
         search_names = []
 
-        grouped_data = data_to_scrape.groupby("fighter_id")
-        for fighter_id, group in grouped_data:
+        grouped_data = dict(list(data_to_scrape.groupby("fighter_id", sort=False)))
+        for fighter_id, group in grouped_data.items():
             group = group[~group["BFO_database_ids"].isna()]
 
             if len(group) > 0:
@@ -875,14 +956,31 @@ class BestFightOddsScraper(BaseScraper):
         records_added = 0
         records_to_add = len(data_to_scrape)
 
-        result_queue, task_queue, workers = self.get_parallel_odds_from_profile_urls(
+        # BFO names already in the names table, as (fighter_id, BFO id, name)
+        BFO_records = self.fighter_names.get_database_records("BestFightOdds")
+        known_BFO_names = set(
+            zip(
+                BFO_records["fighter_id"],
+                BFO_records["database_id"],
+                BFO_records["name"],
+            )
+        )
+
+        result_queue, task_queue, executor = self.get_parallel_odds_from_profile_urls(
             ids,
             search_names,
             bfo_ids,
         )
         with (
-            open(self.data_file, "a") as f_odds,
-            open(self.fighter_names.data_file, "a") as f_names,
+            open(
+                self.data_file, "a", buffering=WRITE_BUFFER_SIZE, newline=""
+            ) as f_odds,
+            open(
+                self.fighter_names.data_file,
+                "a",
+                buffering=WRITE_BUFFER_SIZE,
+                newline="",
+            ) as f_names,
         ):
             writer_odds = csv.writer(f_odds)
             writer_names = csv.writer(f_names)
@@ -893,12 +991,12 @@ class BestFightOddsScraper(BaseScraper):
 
                 if result is not None:
                     odds_records, BFO_names = self.extract_valid_fights_from_odds_data(
-                        grouped_data.get_group(fighter_id),
+                        grouped_data[fighter_id],
                         result,
                     )
 
                     # Write records
-                    [writer_odds.writerow(record) for record in odds_records]
+                    writer_odds.writerows(odds_records)
                     records_added += len(odds_records)
 
                     logger.info(
@@ -908,14 +1006,12 @@ class BestFightOddsScraper(BaseScraper):
 
                     # Check if the valid names are already in the names table
                     # and if not, add them
-                    for id_, bfo_id, name in BFO_names:
-                        if not self.fighter_names.fighter_in_database(
-                            id_,
-                            "BestFightOdds",
-                            name,
-                            bfo_id,
-                        ):
-                            writer_names.writerow([id_, "BestFightOdds", name, bfo_id])
+                    new_names = BFO_names - known_BFO_names
+                    writer_names.writerows(
+                        [id_, "BestFightOdds", name, bfo_id]
+                        for id_, bfo_id, name in new_names
+                    )
+                    known_BFO_names |= new_names
 
                 else:
                     logger.info(
@@ -925,8 +1021,7 @@ class BestFightOddsScraper(BaseScraper):
         for _ in range(self.n_sessions):
             task_queue.put(None)
 
-        for worker in workers:
-            worker.join()
+        executor.shutdown(wait=True)
 
         logger.info("Finished scraping BFO odds.")
         logger.info("Scraped {} records".format(records_added))
@@ -12,7 +12,7 @@ from datetime import datetime
 from typing import TYPE_CHECKING
 
 import pandas as pd
-from fuzzywuzzy import fuzz
+from rapidfuzz import fuzz, process, utils
 
 from ufcscraper.base import BaseScraper
 from ufcscraper.event_scraper import EventScraper
@@ -21,7 +21,7 @@ from ufcscraper.fighter_scraper import FighterScraper
 from ufcscraper.utils import link_to_soup
 
 if TYPE_CHECKING:  # pragma: no cover
-    from typing import Dict, Optional
+    from typing import Dict
 
 logger = logging.getLogger(__name__)
 
@@ -41,7 +41,6 @@ class ReplacementScraper(BaseScraper):  # pragma: no cover
     }
 
     sort_fields = ["fight_id", "fighter_id"]
-    data = pd.DataFrame({col: pd.Series(dtype=dt) for col, dt in dtypes.items()})
     filename = "replacement_data.csv"
     web_url = "https://www.betmma.tips/ufc_late_replacement_fight_stats.php"
 
@@ -92,10 +91,7 @@ class ReplacementScraper(BaseScraper):  # pragma: no cover
 
         # We keep for each records in the original replacement data,
         # only keep the best match using the fighter and opponent names.
-        replacement_data = replacement_data.groupby("Index").apply(
-            self.best_name_match,
-            include_groups=False,
-        )
+        replacement_data = self.best_name_matches(replacement_data)
 
         # We rename the dataframe to have the desired column names.
         replacement_data = (
@@ -133,6 +129,65 @@ class ReplacementScraper(BaseScraper):  # pragma: no cover
 
         self.load_data()
 
+    @staticmethod
+    def best_name_matches(replacement_data: pd.DataFrame) -> pd.DataFrame:
+        """
+        Select the UFCStats fight matching each replacement record.
+
+        For each record (identified by the field 'Index') it checks the rows
+        where 'Late Replacement' agrees with 'fighter_name' and 'Opponent'
+        agrees with 'opponent_name'.
+
+        It will require both fields to agree with a score >= 80, if multiple
+        rows are compatible, the best match is kept. Every distinct pair of
+        names in the data is scored once, in a single batch.
+
+        Args:
+            replacement_data: Replacement records merged with the UFCStats
+                fights of the same date.
+
+        Returns:
+            A pandas dataframe with the best matching row of each record,
+                records without a valid match are dropped.
+        """
+        replacement_data = replacement_data.copy()
+
+        for query, choice, score in (
+            ("Late Replacement", "fighter_name", "name_score"),
+            ("Opponent", "opponent_name", "opponent_score"),
+        ):
+            # Missing names are kept as their own code and score 0.
+            query_codes, queries = pd.factorize(
+                replacement_data[query], use_na_sentinel=False
+            )
+            choice_codes, choices = pd.factorize(
+                replacement_data[choice], use_na_sentinel=False
+            )
+            # Only the pairs present in the data are scored, each of them once.
+            pair_codes, pairs = pd.factorize(query_codes * len(choices) + choice_codes)
+            scores = process.cpdist(
+                [
+                    name if isinstance(name, str) else None
+                    for name in queries[pairs // len(choices)]
+                ],
+                [
+                    name if isinstance(name, str) else None
+                    for name in choices[pairs % len(choices)]
+                ],
+                scorer=fuzz.WRatio,
+                processor=utils.default_process,
+                workers=-1,
+            )
+            # Scores are rounded to integers, as with the former fuzzywuzzy
+            # scorer, before comparing them with the threshold.
+            replacement_data[score] = scores[pair_codes].round()
+
+        valid_matches = replacement_data[
+            (replacement_data["name_score"] >= 80)
+            & (replacement_data["opponent_score"] >= 80)
+        ]
+        return valid_matches.loc[valid_matches.groupby("Index")["name_score"].idxmax()]
+
     def get_ufc_stats_data(self) -> pd.DataFrame:
         """
         Read and prepare UFC stats data to be merged into scraped
@@ -197,38 +252,3 @@ class ReplacementScraper(BaseScraper):  # pragma: no cover
         )
 
         return ufc_data
-
-    # Function to apply on a pandas dataframe group.
-    @staticmethod
-    def best_name_match(group: pd.DataFrame) -> Optional[pd.Series]:
-        """
-        This function is designed to be applied on a grouped dataframe.
-
-        It will check the match in the group where the field 'Late Replacement'
-        agrees with 'fighter_name' and where 'Opponent' agrees with 'opponent_name'.
-
-        It will require both fields to agree with a score > 80, if multiple
-        records are compatible, the best match will be returned.
-
-        Returns:
-            A pandas series with the matching record (if existing).
-        """
-        replacement_name = group["Late Replacement"].values[0]
-        opponent_name = group["Opponent"].values[0]
-
-        group["name_score"] = group["fighter_name"].apply(
-            lambda x: fuzz.WRatio(replacement_name, x)
-        )
-        group["opponent_score"] = group["opponent_name"].apply(
-            lambda x: fuzz.WRatio(opponent_name, x)
-        )
-
-        valid_matches = group[
-            (group["name_score"] >= 80) & (group["opponent_score"] >= 80)
-        ]
-
-        if not valid_matches.empty:
-            best_match_idx = valid_matches["name_score"].idxmax()
-            return valid_matches.loc[best_match_idx]
-        else:
-            return None
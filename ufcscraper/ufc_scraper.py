@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import TYPE_CHECKING
 
@@ -61,9 +62,13 @@ class UFCScraper(BaseScraper):
             self.data_folder, n_sessions, delay
         )
         self.fighter_scraper = FighterScraper(self.data_folder, n_sessions, delay)
-        self.fight_scraper = FightScraper(self.data_folder, n_sessions, delay)
+        # The fight scrapers share the event scrapers, so event pages that
+        # were already downloaded are not downloaded again.
+        self.fight_scraper = FightScraper(
+            self.data_folder, n_sessions, delay, self.event_scraper
+        )
         self.upcoming_fight_scraper = UpcomingFightScraper(
-            self.data_folder, n_sessions, delay
+            self.data_folder, n_sessions, delay, self.upcoming_event_scraper
         )
         self.replacement_scraper = ReplacementScraper(self.data_folder)
         self.catch_weights = CatchWeights(self.data_folder)
@@ -73,18 +78,21 @@ class UFCScraper(BaseScraper):
             self.upcoming_event_scraper,
             self.fighter_scraper,
             self.fight_scraper,
+            self.fight_scraper.rounds_handler,
             self.upcoming_fight_scraper,
             self.replacement_scraper,
             self.catch_weights,
         ]
 
-    def check_data_file(self) -> None:
+    def check_data_file(self) -> bool:
         """Check the integrity of data files for all scrapers.
 
         This method iterates over all scrapers and verifies their data files.
+
+        Returns:
+            True if all the data files already existed.
         """
-        for scraper in self.scrapers:
-            scraper.check_data_file()
+        return all([scraper.check_data_file() for scraper in self.scrapers])
 
     def load_data(self) -> None:
         """Load data for all scrapers.
@@ -97,10 +105,16 @@ class UFCScraper(BaseScraper):
     def remove_duplicates_from_file(self) -> None:
         """Remove duplicate entries from data files for all scrapers.
 
-        This method iterates over all scrapers and removes duplicates from their data files.
+        Each scraper reads and writes its own CSV file, so the files are
+        processed concurrently in a pool of threads.
         """
-        for scraper in self.scrapers:
-            scraper.remove_duplicates_from_file()
+        with ThreadPoolExecutor(max_workers=len(self.scrapers)) as executor:
+            list(
+                executor.map(
+                    lambda scraper: scraper.remove_duplicates_from_file(),
+                    self.scrapers,
+                )
+            )
 
     def scrape_fighters(self) -> None:
         """Scrape fighter data.
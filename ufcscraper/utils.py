@@ -1,9 +1,12 @@
 from __future__ import annotations
 
+import datetime
 import logging
-import multiprocessing
 import re
 import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from functools import lru_cache
 from typing import TYPE_CHECKING
 
 import bs4
@@ -13,20 +16,37 @@ from requests.adapters import HTTPAdapter
 from urllib3.util import Retry
 
 if TYPE_CHECKING:
-    import datetime
-    from typing import Callable, Generator, List, Optional, Tuple, TypeVar, Any
+    from typing import (
+        Any,
+        Callable,
+        Generator,
+        List,
+        Optional,
+        Tuple,
+        TypeVar,
+    )
     from selenium import webdriver
     from selenium.webdriver.remote.webelement import WebElement
 
     T = TypeVar("T")
+    R = TypeVar("R")
 
 logger = logging.getLogger(__name__)
 
+ORDINAL_RE = re.compile(r"(\d)(nd|st|rd|th)")
+# Formats tried before falling back to dateutil (e.g. "Jun 30 2024")
+DATE_FORMATS = ("%b %d %Y", "%B %d %Y", "%b %d, %Y", "%B %d, %Y")
+
 
-def get_session() -> requests.Session:
+def get_session(pool_size: int = 10) -> requests.Session:
     """
     Create and configure a new `requests.Session` object with retry functionality.
 
+    Args:
+        pool_size: Number of connections kept alive per host. When the
+            session is shared by several threads it should be at least
+            the number of threads.
+
     Returns:
         requests.Session: A configured session object with retry strategy.
     """
@@ -36,7 +56,11 @@ def get_session() -> requests.Session:
         status_forcelist=[429, 500, 502, 503, 504],  # HTTP status codes to retry on
     )
 
-    adapter = HTTPAdapter(max_retries=retry_strategy)
+    adapter = HTTPAdapter(
+        max_retries=retry_strategy,
+        pool_connections=pool_size,
+        pool_maxsize=pool_size,
+    )
 
     session = requests.Session()
     session.mount("http://", adapter)
@@ -53,8 +77,8 @@ def links_to_soups(
     Create a generator that yields tuples of URLs and their corresponding
     BeautifulSoup objects.
 
-    This function uses multiple processes to fetch and parse web pages
-    concurrently.
+    The pages are fetched concurrently by `links_to_htmls`, in a pool of
+    threads of the current process, and parsed as they arrive.
 
     Args:
         urls: List of URLs to be scraped.
@@ -66,51 +90,126 @@ def links_to_soups(
     Returns:
         Tuples containing the URL and the corresponding BeautifulSoup object.
     """
-    task_queue: multiprocessing.Queue = multiprocessing.Queue()
-    result_queue: multiprocessing.Queue = multiprocessing.Queue()
+    for url, html in links_to_htmls(urls, n_sessions, delay):
+        yield url, bs4.BeautifulSoup(html, "lxml")
 
-    urls_scraped = 0
-    urls_to_scrape = len(urls)
-    # Adding tasks
-    for url in urls:
-        task_queue.put((url,))
 
-    # Define worker around link_to_soup
-    worker_target = worker_constructor(
-        lambda x, session: (x, link_to_soup(x, session, delay))
-    )
+class PageCache:
+    """Least recently used cache of HTML pages, keyed by URL.
 
-    sessions = [get_session() for _ in range(n_sessions)]
-    # Starting workers
-    workers = [
-        multiprocessing.Process(
-            target=worker_target,
-            args=(task_queue, result_queue, session),
-        )
-        for session in sessions
-    ]
+    Used to avoid downloading again pages that are read by more than one
+    scraper in the same run.
+
+    Attributes:
+        maxsize: Maximum number of pages kept in the cache.
+    """
+
+    def __init__(self, maxsize: int = 1024):
+        """Initializes an empty cache.
+
+        Args:
+            maxsize: Maximum number of pages kept in the cache.
+        """
+        self.maxsize = maxsize
+        self.pages: OrderedDict[str, bytes] = OrderedDict()
+
+    def get(self, url: str) -> Optional[bytes]:
+        """Returns the cached page for `url`, or None if not cached."""
+        html = self.pages.get(url)
+        if html is not None:
+            self.pages.move_to_end(url)
+        return html
+
+    def add(self, url: str, html: bytes) -> None:
+        """Stores a page, evicting the least recently used one if full."""
+        self.pages[url] = html
+        self.pages.move_to_end(url)
+        if len(self.pages) > self.maxsize:
+            self.pages.popitem(last=False)
+
+
+def links_to_htmls(
+    urls: List[str],
+    n_sessions: int = 1,
+    delay: float = 0,
+    max_exception_retries: int = 4,
+    cache: Optional[PageCache] = None,
+) -> Generator[Tuple[str, bytes]]:
+    """Fetch the HTML content from given URLs.
+
+    Create a generator that yields tuples of URLs and their corresponding
+    HTML content, in the order in which the downloads finish.
+
+    Fetching is network bound, so a pool of threads keeps up to
+    `n_sessions` requests in flight, and parsing is left to the caller in
+    the main thread. All the threads share a single session, so the
+    keep-alive connections are reused across all the requests.
+
+    The pages are returned as the raw bytes of the responses, the parsers
+    read the encoding from the document, so there is no need to decode
+    them into strings first.
+
+    Args:
+        urls: List of URLs to be fetched.
+        n_sessions: Number of concurrent sessions to use
+            for fetching. Defaults to 1.
+        delay: Delay in seconds to wait before making each
+            request. Defaults to 0.
+        max_exception_retries: Maximum number of retries for each URL.
+        cache: If given, pages found in the cache are not downloaded again
+            and downloaded pages are added to it.
+
+    Returns:
+        Tuples containing the URL and the corresponding HTML content. URLs
+            that could not be fetched are skipped.
+    """
+    n_sessions = max(n_sessions, 1)
+    session = get_session(pool_size=n_sessions)
+
+    def fetch(url: str) -> Optional[Tuple[str, bytes]]:
+        if delay > 0:
+            time.sleep(delay)
 
-    for worker in workers:
-        worker.start()
+        for attempt in range(max_exception_retries + 1):
+            try:
+                return url, session.get(url).content
+            except Exception as e:
+                # Broken connections are discarded by the pool, the
+                # next attempt opens a new one.
+                logger.error(f"Attempt {attempt + 1} failed for url {url}: {e}")
+
+        return None
 
+    cached: List[Tuple[str, bytes]] = []
+    urls_to_fetch = []
+    for url in urls:
+        html = cache.get(url) if cache is not None else None
+        if html is not None:
+            cached.append((url, html))
+        else:
+            urls_to_fetch.append(url)
+
+    pool = ThreadPoolExecutor(max_workers=n_sessions)
     try:
-        while urls_scraped < urls_to_scrape:
-            result = result_queue.get()
-            urls_scraped += 1
+        futures = [pool.submit(fetch, url) for url in urls_to_fetch]
+        yield from cached
 
+        for future in as_completed(futures):
+            result = future.result()
             if result is not None:
+                if cache is not None:
+                    cache.add(*result)
                 yield result
     finally:
-        for session in sessions:
-            session.close()
-            task_queue.put(None)
-
-        for worker in workers:
-            worker.join()
+        pool.shutdown(wait=True, cancel_futures=True)
+        session.close()
 
 
 def link_to_soup(
-    url: str, session: Optional[requests.Session] = None, delay: float = 0
+    url: str,
+    session: Optional[requests.Session] = None,
+    delay: float = 0,
+    parse_only: Optional[bs4.SoupStrainer] = None,
 ) -> bs4.BeautifulSoup:
     """Parse the HTML content of a given URL into a BeautifulSoup object.
 
@@ -119,6 +218,8 @@ def link_to_soup(
         session: A requests session object. If not provided, a new session
             will be created.
         delay: Delay in seconds before making the request.
+        parse_only: If given, only the elements matching it are added to
+            the soup, which is much cheaper for large pages.
 
     Returns:
         Parsed BeautifulSoup object containing the HTML content of the page.
@@ -128,69 +229,15 @@ def link_to_soup(
 
     if session is None:
         session = get_session()
-        soup = bs4.BeautifulSoup(session.get(url).text, "lxml")
+        soup = bs4.BeautifulSoup(
+            session.get(url).content, "lxml", parse_only=parse_only
+        )
         session.close()
         return soup
     else:
-        return bs4.BeautifulSoup(session.get(url).text, "lxml")
-
-
-def worker_constructor(
-    method: Callable[..., T],
-    max_exception_retries: int = 4,
-) -> Callable[[multiprocessing.Queue, multiprocessing.Queue, requests.Session], None]:
-    """Create a worker target function for processing tasks with retry functionality.
-
-    Args:
-        method: The function to be executed by the worker.
-        max_exception_retries : Maximum number of retries for handling exceptions.
-
-    Returns:
-        A worker function that processes tasks from a queue and puts results in
-            another queue.
-    """
-
-    def worker(
-        task_queue: multiprocessing.Queue,
-        result_queue: multiprocessing.Queue,
-        session: requests.Session,
-    ) -> None:
-        while True:
-            try:
-                task = task_queue.get()
-                if task is None:
-                    break
-
-                args = task
-                result: Optional[T] = None
-
-                for attempt in range(max_exception_retries + 1):
-                    try:
-                        result = method(*args, session)
-                        result_queue.put(result)
-                        break
-                    except Exception as e:
-                        logging.error(
-                            f"Attempt {attempt + 1} failed for task {task}: {e}"
-                        )
-                        logging.exception("Exception occurred")
-
-                        # Reset the driver after a failed attempt
-                        session.close()
-                        session = get_session()
-
-            except Exception as e:
-                logging.error(f"Error processing task {task}: {e}")
-                logging.exception("Exception ocurred")
-
-                # Reset the driver after a failed attempt
-                session.close()
-                session = get_session()
-
-                # Send None to the result because task failed
-                result_queue.put(None)
-
-    return worker
+        return bs4.BeautifulSoup(
+            session.get(url).content, "lxml", parse_only=parse_only
+        )
 
 
 class element_present_in_list(object):
@@ -225,6 +272,11 @@ class element_present_in_list(object):
         return False
 
 
+def xpath_with_class(class_name: str) -> str:
+    """XPath predicate matching elements whose class list contains `class_name`."""
+    return f"contains(concat(' ', normalize-space(@class), ' '), ' {class_name} ')"
+
+
 def clean_date_string(date_str: str) -> str:
     """
     Clean a date string to remove incorrect ordinal suffixes and make it
@@ -237,13 +289,17 @@ def clean_date_string(date_str: str) -> str:
         str: The cleaned date string.
     """
     # Replace incorrect ordinal suffixes
-    date_str = re.sub(r"(\d)(nd|st|rd|th)", r"\1", date_str)
+    date_str = ORDINAL_RE.sub(r"\1", date_str)
     return date_str
 
 
+@lru_cache(maxsize=None)
 def parse_date(date_str: str) -> Optional[datetime.date]:
     """Parse a date string into a `datetime.date` object.
 
+    Results are memoized, fighters from the same event share the
+    same date strings.
+
     Args:
         date_str (str): The date string to be parsed.
 
@@ -254,6 +310,13 @@ def parse_date(date_str: str) -> Optional[datetime.date]:
     # Clean the date string
     cleaned_date_str = clean_date_string(date_str)
 
+    # Try the usual formats first, dateutil is much slower.
+    for date_format in DATE_FORMATS:
+        try:
+            return datetime.datetime.strptime(cleaned_date_str, date_format).date()
+        except ValueError:
+            pass
+
     # Parse the cleaned date string into a datetime object
     try:
         date_obj = parser.parse(cleaned_date_str)